@@ -19,7 +19,7 @@ import json
 import logging
 import sys
 import time
-from typing import Optional
+from typing import List, Union
 
 from governor.constants import PREDEFINED_URLS
 from . import revision_command
@@ -62,7 +62,7 @@ def main() -> int:
 
     _init_logger(args)
 
-    ret: Optional[int, str] = args.func(args)
+    ret: Union[int, str, List] = args.func(args)
     if isinstance(ret, str):
         print_response(ret)
 
@@ -70,6 +70,8 @@ def main() -> int:
             ret = _print_tx_result(args, tx_hash=ret)
         else:
             ret = 0
+    elif isinstance(ret, list):
+        ret = _print_tx_results(args, ret)
 
     return ret
 
@@ -136,6 +138,18 @@ def _print_tx_result(args, tx_hash: str) -> int:
     return ret
 
 
+def _print_tx_results(args, results: List) -> int:
+    """Print the results of a command which sends several transactions
+
+    :param results: tx_hash of each transaction or an error for one which has not been sent
+    """
+    for result in results:
+        if isinstance(result, str) and not args.no_result:
+            _print_tx_result(args, tx_hash=result)
+
+    return 0 if all(isinstance(result, str) for result in results) else 1
+
+
 def _get_epilog() -> str:
     words = ["predefined urls:"]
 
@@ -212,6 +226,12 @@ def create_invoke_parser() -> argparse.ArgumentParser:
         required=False,
         help="Automatic yes to prompts"
     )
+    parent_parser.add_argument(
+        "--estimate-step-limit",
+        action="store_true",
+        required=False,
+        help="Send a transaction with the step limit estimated by the node"
+    )
 
     return parent_parser
 
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple, Union
+
+from .utils import import_orjson
+
+
+class RPCCacheConfig(object):
+    __slots__ = ("enabled", "ttl", "maxsize")
+
+    def __init__(self, enabled: bool = False, ttl: float = 300.0, maxsize: int = 256):
+        """
+        :param enabled: whether to cache the results of read-only calls.
+            Disabled by default, as cached results are stale after a writer changes the governance state
+            until they expire or the cache is cleared
+        :param ttl: seconds for which a cached result is valid
+        :param maxsize: the max number of cached results
+        """
+        self.enabled = enabled
+        self.ttl = ttl
+        self.maxsize = maxsize
+
+
+class RPCCache(object):
+    """LRU cache whose entries expire after ttl seconds
+
+    Values are copied when they are put and got,
+    so callers may modify the dicts and lists they get without affecting the cache
+    """
+
+    __slots__ = ("_config", "_cache")
+
+    def __init__(self, config: RPCCacheConfig):
+        self._config = config
+        self._cache = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.enabled
+
+    @staticmethod
+    def make_key(method: str, params: Optional[dict]) -> Tuple[str, Union[str, bytes, None]]:
+        if not params:
+            # Most calls have no params, which need no serialization
+            return method, None
+
+        orjson = import_orjson()
+        if orjson is not None:
+            try:
+                return method, orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+            except TypeError:
+                # orjson does not support integers which exceed 64 bits
+                pass
+
+        return method, json.dumps(params, sort_keys=True)
+
+    def get(self, key: Tuple[str, Union[str, bytes, None]], default: Any = None) -> Any:
+        item = self._cache.get(key)
+        if item is None:
+            return default
+
+        expire_at, value = item
+        if expire_at < time.monotonic():
+            del self._cache[key]
+            return default
+
+        self._cache.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def put(self, key: Tuple[str, Union[str, bytes, None]], value: Any):
+        self._cache[key] = time.monotonic() + self._config.ttl, copy.deepcopy(value)
+        self._cache.move_to_end(key)
+
+        while len(self._cache) > self._config.maxsize:
+            self._cache.popitem(last=False)
+
+    def clear(self):
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
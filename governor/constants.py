@@ -24,6 +24,18 @@ DEFAULT_NID = 3
 
 COLUMN = 80
 
+# URL: https://github.com/icon-project/governance#getstepcosts
+STEP_TYPES = (
+    "default", "contractCall", "contractCreate", "contractUpdate", "contractDestruct",
+    "contractSet", "get", "set", "replace", "delete", "input", "eventlog", "apiCall"
+)
+
+# The max number of requests in a JSON-RPC batch request
+DEFAULT_BATCH_SIZE = 25
+
+# The max number of concurrent requests in GovernanceReader.gather_calls()
+DEFAULT_CONCURRENCY = 8
+
 PREDEFINED_URLS = {
     "mainnet": "https://ctz.solidwallet.io/api/v3",
     "testnet": "https://test-ctz.solidwallet.io/api/v3",
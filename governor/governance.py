@@ -14,24 +14,46 @@
 
 import functools
 import getpass
+import json
 import logging
 import os.path
+import re
+import stat
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
-from iconsdk.builder.call_builder import CallBuilder
-from iconsdk.builder.transaction_builder import (
-    DeployTransactionBuilder,
-    CallTransactionBuilder,
-    Transaction,
+from .cache import RPCCache, RPCCacheConfig
+from .constants import (
+    EOA_ADDRESS, GOVERNANCE_ADDRESS, ZERO_ADDRESS, COLUMN, DEFAULT_BATCH_SIZE, DEFAULT_CONCURRENCY, STEP_TYPES
 )
-from iconsdk.icon_service import IconService
-from iconsdk.libs.in_memory_zip import gen_deploy_data_content
-from iconsdk.providers.http_provider import HTTPProvider
-from iconsdk.signed_transaction import SignedTransaction
-from iconsdk.wallet.wallet import KeyWallet
-from .constants import EOA_ADDRESS, GOVERNANCE_ADDRESS, ZERO_ADDRESS, COLUMN
+from .results import ServiceConfig, StepCosts
 from .utils import print_title, print_dict, get_url
 
+# iconsdk takes hundreds of milliseconds to import, so it is imported on first use
+if TYPE_CHECKING:
+    from iconsdk.builder.call_builder import Call
+    from iconsdk.builder.transaction_builder import Transaction
+    from iconsdk.icon_service import IconService
+    from iconsdk.signed_transaction import SignedTransaction
+    from iconsdk.wallet.wallet import KeyWallet
+    from .provider import HTTPProvider
+
+logger = logging.getLogger(__name__)
+
+# Read-only governance methods whose results can be cached
+READONLY_ALLOWLIST = frozenset({
+    "getVersion", "getRevision", "getServiceConfig", "getStepPrice", "getStepCosts",
+    "getMaxStepLimit", "isDeployer", "isInScoreBlackList", "isInImportWhiteList"
+})
+
+# URL: https://github.com/icon-project/governance#setstepcost
+_STEP_TYPES = frozenset(STEP_TYPES)
+_CONTEXT_TYPES = frozenset({"invoke", "query"})
+
+# Extra steps in percent given to a transaction sent with the estimated steps,
+# as the steps it uses can change by the state between the estimate and the execution
+_ESTIMATED_STEP_MARGIN = 10
+
 
 def _print_request(title: str, content: dict):
     print_title(title, COLUMN)
@@ -39,13 +61,25 @@ def _print_request(title: str, content: dict):
     print("")
 
 
+# Created once and shared by all readers and writers
+_PRINT_REQUEST_CALLBACK = functools.partial(_print_request, "Request")
+
+# Fields of a call transaction which governor never sets
+# version and timestamp are filled with defaults when the transaction is signed
+_CALL_TX_TEMPLATE = {"value": None, "nonce": None, "version": None, "timestamp": None}
+
+
 class TxBuildHelper:
+    __slots__ = ("_icon_service", "_nid")
+
     def __init__(self, service, nid: int):
         self._icon_service = service
         self._nid = nid
 
-    def _deploy(self, owner, to, content, params, step_limit) -> Transaction:
-        logging.debug("TxBuildHelper._deploy() start")
+    def _deploy(self, owner, to, content, params, step_limit) -> 'Transaction':
+        from iconsdk.builder.transaction_builder import DeployTransactionBuilder
+
+        logger.debug("TxBuildHelper._deploy() start")
 
         transaction = DeployTransactionBuilder() \
             .from_(owner.get_address()) \
@@ -58,37 +92,48 @@ class TxBuildHelper:
             .params(params) \
             .build()
 
-        logging.debug("TxBuildHelper._deploy() end")
+        logger.debug("TxBuildHelper._deploy() end")
         return transaction
 
-    def install(self, owner, content, params=None, step_limit=0x50000000) -> Transaction:
+    def install(self, owner, content, params=None, step_limit=0x50000000) -> 'Transaction':
         return self._deploy(owner, ZERO_ADDRESS, content, params, step_limit)
 
-    def update(self, owner, to, content, params=None, step_limit=0x80000000) -> Transaction:
-        logging.debug("TxBuilderHelper.update() start")
+    def update(self, owner, to, content, params=None, step_limit=0x80000000) -> 'Transaction':
+        logger.debug("TxBuilderHelper.update() start")
         transaction = self._deploy(owner, to, content, params, step_limit)
-        logging.debug("TxBuilderHelper.update() end")
+        logger.debug("TxBuilderHelper.update() end")
 
         return transaction
 
-    def invoke(self, owner, to, method, params, step_limit=0x10000000):
-        return CallTransactionBuilder() \
-            .from_(owner.get_address()) \
-            .to(to) \
-            .step_limit(step_limit) \
-            .nid(self._nid) \
-            .method(method) \
-            .params(params) \
-            .build()
+    def invoke(self, owner, to, method, params, step_limit=0x10000000) -> 'Transaction':
+        from iconsdk.builder.transaction_builder import CallTransaction
+
+        # Same as what CallTransactionBuilder builds, without its chain of setters
+        return CallTransaction(
+            from_=owner.get_address(),
+            to=to,
+            step_limit=step_limit,
+            nid=self._nid,
+            method=method,
+            params=params,
+            **_CALL_TX_TEMPLATE
+        )
 
 
 class TxHandler:
+    # A handler is created for every transaction
+    __slots__ = ("_icon_service", "_nid", "_on_send_request", "_tx_build_helper")
+
     def __init__(self, service, nid: int, on_send_request: callable(dict)):
         self._icon_service = service
         self._nid = nid
         self._on_send_request = on_send_request
         self._tx_build_helper = TxBuildHelper(service, nid)
 
+    @property
+    def tx_build_helper(self) -> TxBuildHelper:
+        return self._tx_build_helper
+
     def _call_on_send_request(self, content: dict) -> bool:
         if self._on_send_request:
             return self._on_send_request(content)
@@ -108,36 +153,123 @@ class TxHandler:
         transaction = self._tx_build_helper.invoke(owner, to, method, params, step_limit)
         return self._run(transaction, owner, estimate)
 
-    def _run(self, transaction: Transaction, owner: KeyWallet, estimate: bool):
-        logging.debug("TxHandler._run() start")
+    def _run(self, transaction: 'Transaction', owner: 'KeyWallet', estimate: bool):
+        """Estimate steps for a transaction or send it
+
+        A transaction without step limit is sent with the estimated steps
+        and a margin of _ESTIMATED_STEP_MARGIN percent.
+        The same transaction object is estimated and signed, so it is never built twice.
+        """
+        logger.debug("TxHandler._run() start")
 
         if estimate:
             ret = self._estimate_step(transaction)
         else:
+            self._fill_step_limit(transaction)
             ret = self._send_transaction(owner, transaction)
 
-        logging.debug("TxHandler._run() end")
+        logger.debug("TxHandler._run() end")
         return ret
 
-    def _send_transaction(self, owner: KeyWallet, transaction: Transaction):
-        logging.debug("TxHandler._send_transaction() start")
+    def _send_transaction(self, owner: 'KeyWallet', transaction: 'Transaction'):
+        from iconsdk.signed_transaction import SignedTransaction
+
+        logger.debug("TxHandler._send_transaction() start")
 
         ret = self._call_on_send_request(transaction.to_dict())
         if ret:
             ret = self._icon_service.send_transaction(SignedTransaction(transaction, owner))
 
-        logging.debug("TxHandler._send_transaction() end")
+        logger.debug("TxHandler._send_transaction() end")
         return ret
 
-    def _estimate_step(self, transaction: Transaction) -> int:
-        logging.debug("TxHandler._estimate_step() start")
+    def sign(self, owner: 'KeyWallet', transaction: 'Transaction') -> Optional['SignedTransaction']:
+        """Sign a transaction to send it later
+
+        A transaction without step limit is signed with the estimated steps as _run() does
+
+        :return: None if on_send_request declines the transaction
+        """
+        from iconsdk.signed_transaction import SignedTransaction
+
+        self._fill_step_limit(transaction)
+        if not self._call_on_send_request(transaction.to_dict()):
+            return None
+
+        return SignedTransaction(transaction, owner)
+
+    def _fill_step_limit(self, transaction: 'Transaction'):
+        if transaction.step_limit is None:
+            steps: int = self._estimate_step(transaction)
+            transaction.step_limit = steps + steps * _ESTIMATED_STEP_MARGIN // 100
+
+    def _estimate_step(self, transaction: 'Transaction') -> int:
+        logger.debug("TxHandler._estimate_step() start")
         ret = self._icon_service.estimate_step(transaction)
-        logging.debug("TxHandler._estimate_step() end")
+        logger.debug("TxHandler._estimate_step() end")
 
         return ret
 
 
+class KeystoreWallet(object):
+    """Wallet which decrypts its keystore file only when it signs for the first time
+
+    Estimating steps needs only the address, which a keystore file holds in plain text,
+    so it can skip both the password prompt and the expensive key derivation.
+    The plain text address is checked against the key once the keystore file is decrypted.
+    """
+
+    def __init__(self, keystore_path: str, password: Optional[str] = None):
+        self._keystore_path = keystore_path
+        self._password = password
+        self._address: Optional[str] = None
+
+    @functools.cached_property
+    def _wallet(self) -> 'KeyWallet':
+        from iconsdk.wallet.wallet import KeyWallet
+
+        password = self._password
+        if password is None:
+            password = getpass.getpass("> Password: ")
+
+        wallet = KeyWallet.load(self._keystore_path, password)
+        # The password is of no use once the key is derived
+        self._password = None
+
+        address: str = wallet.get_address()
+        expected: Optional[str] = self._address or self._read_address()
+        if expected and expected != address:
+            raise ValueError(f"Address mismatch: keystore={expected} key={address}")
+
+        self._address = address
+        return wallet
+
+    def _read_address(self) -> Optional[str]:
+        with open(self._keystore_path, "r") as f:
+            return json.load(f).get("address")
+
+    def unlock(self):
+        """Decrypt the keystore file, asking the password if it was not given
+
+        It raises an exception if the password is wrong or the key does not match the address
+        """
+        # Loading the cached property is all it takes
+        self._wallet
+
+    def get_address(self) -> str:
+        if self._address is None:
+            address: Optional[str] = self._read_address()
+            self._address = address if address else self._wallet.get_address()
+
+        return self._address
+
+    def sign(self, data: bytes) -> bytes:
+        return self._wallet.sign(data)
+
+
 class GovernanceListener(object):
+    __slots__ = ("_on_send_request",)
+
     def __init__(self):
         self._on_send_request = None
 
@@ -150,81 +282,378 @@ class GovernanceListener(object):
 
 
 class GovernanceReader(GovernanceListener):
-    def __init__(self, service, nid: int, address: str = EOA_ADDRESS):
+    __slots__ = (
+        "_icon_service", "_nid", "_from", "_provider", "_batch_size", "_cache", "_call_template", "_service_config"
+    )
+
+    def __init__(self, service, nid: int, address: str = EOA_ADDRESS,
+                 provider: Optional['HTTPProvider'] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                 cache_config: Optional[RPCCacheConfig] = None):
         super().__init__()
 
         self._icon_service = service
         self._nid = nid
-        self._from = address
+        # Stringify addresses once here rather than on every serialization of params
+        self._from: str = str(address)
+        self._provider = provider
+        self._batch_size = batch_size
+        self._cache = RPCCache(cache_config or RPCCacheConfig())
+        # getServiceConfig response which is kept until clear_cache() even if the cache is disabled
+        self._service_config: Optional[dict] = None
+
+        # icx_call params which are the same for every call
+        self._call_template = {
+            "from": self._from,
+            "to": GOVERNANCE_ADDRESS,
+            "dataType": "call"
+        }
 
-    def _call(self, method, params=None):
-        call = CallBuilder() \
-            .from_(self._from) \
-            .to(GOVERNANCE_ADDRESS) \
-            .method(method) \
-            .params(params) \
-            .build()
+    def _create_call_params(self, method: str, params: Optional[dict] = None) -> dict:
+        """Build icx_call params without going through CallBuilder
+
+        They are built for every call and never shared,
+        as both callers and on_send_request callbacks may modify them
+        """
+        data = {"method": method}
+        if isinstance(params, dict):
+            data["params"] = dict(params)
+
+        return {**self._call_template, "data": data}
+
+    def _send_call(self, call_params: dict):
+        if self._provider is None:
+            return self._icon_service.call(_to_call(call_params))
+
+        return self._provider.make_request("icx_call", call_params)
+
+    def _call(self, method, params=None, batch: Optional['CallBatch'] = None):
+        if batch is not None:
+            return batch.add(method, params)
+
+        ret = self._get_cached_result(method, params)
+        if ret is not None:
+            return ret
+
+        call_params = self._create_call_params(method, params)
+
+        self.on_send_request(call_params)
+
+        ret = self._send_call(call_params)
+        self._cache_result(method, params, ret)
+
+        return ret
+
+    def _call_as(self, method: str, converter: Callable, params: Optional[dict] = None,
+                 batch: Optional['CallBatch'] = None):
+        """Call a method and convert its result
+
+        A cached result is kept unconverted
+        """
+        if batch is not None:
+            return batch.add(method, params, converter)
 
-        self.on_send_request(call.to_dict())
+        return converter(self._call(method, params))
 
-        return self._icon_service.call(call)
+    def _call_int(self, method: str, params: Optional[dict] = None, batch: Optional['CallBatch'] = None) -> int:
+        """Call a method which returns a hex string like "0x1a"
+        """
+        return self._call_as(method, _hex_to_int, params, batch)
+
+    def _is_cacheable(self, method: str) -> bool:
+        return self._cache.enabled and method in READONLY_ALLOWLIST
+
+    def _get_cached_result(self, method: str, params: Optional[dict]):
+        if not self._is_cacheable(method):
+            return None
+
+        return self._cache.get(RPCCache.make_key(method, params))
+
+    def _cache_result(self, method: str, params: Optional[dict], result):
+        if self._is_cacheable(method):
+            self._cache.put(RPCCache.make_key(method, params), result)
+
+    def clear_cache(self):
+        """Forget cached results
+
+        Call it after the governance state is changed by a writer
+        """
+        self._cache.clear()
+        self._service_config = None
 
-    def get_version(self):
-        return self._call("getVersion")
+    def batch_call(self, requests: List[Tuple[str, Optional[dict]]]) -> list:
+        """Call several governance methods with one JSON-RPC batch request
 
-    def get_revision(self):
-        return self._call("getRevision")
+        :param requests: list of (method, params)
+        :return: results which are parallel to requests
+        """
+        results = [self._get_cached_result(method, params) for method, params in requests]
+        indexes = [i for i, ret in enumerate(results) if ret is None]
+        if len(indexes) == 0:
+            return results
 
-    def get_service_config(self):
-        return self._call("getServiceConfig")
+        calls = [self._create_call_params(*requests[i]) for i in indexes]
 
-    def get_score_status(self, address: str) -> dict:
-        params = {"address": address}
-        return self._call("getScoreStatus", params)
+        for call_params in calls:
+            self.on_send_request(call_params)
 
-    def check_if_audit_enabled(self):
-        service_config = self.get_service_config()
-        if service_config['AUDIT'] == '0x1':
-            return True
+        if self._provider is None:
+            rets = [self._send_call(call_params) for call_params in calls]
         else:
-            return False
+            rets = self._provider.make_batch_request(
+                [("icx_call", call_params) for call_params in calls],
+                self._batch_size
+            )
+
+        for i, ret in zip(indexes, rets):
+            method, params = requests[i]
+            self._cache_result(method, params, ret)
+            results[i] = ret
+
+        return results
+
+    def create_batch(self) -> 'CallBatch':
+        """Create a batch to which getters add their calls instead of sending them
+
+        ex) batch = reader.create_batch()
+            reader.get_revision(batch=batch)
+            reader.get_step_price(batch=batch)
+            revision, step_price = batch.execute()
+        """
+        return CallBatch(self)
+
+    async def acall(self, method: str, params: Optional[dict] = None, session=None):
+        """Asynchronous version of _call()
+
+        :param method: governance method
+        :param params: governance method params
+        :param session: a session created by HTTPProvider.create_async_session()
+        """
+        ret = self._get_cached_result(method, params)
+        if ret is not None:
+            return ret
+
+        import asyncio
+
+        if session is None and not self._can_send_async():
+            # Without any async HTTP client, the blocking call runs in a thread instead
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._call, method, params)
+
+        call_params = self._create_call_params(method, params)
+
+        self.on_send_request(call_params)
+
+        ret = await self._provider.make_async_request("icx_call", call_params, session)
+        self._cache_result(method, params, ret)
+
+        return ret
+
+    async def gather_calls(self, requests: List[Tuple[str, Optional[dict]]],
+                           concurrency: int = DEFAULT_CONCURRENCY, return_exceptions: bool = False) -> list:
+        """Run independent calls concurrently
+
+        Unlike batch_call(), a failed call does not affect the others if return_exceptions is True
+
+        :param requests: list of (method, params)
+        :param concurrency: the max number of calls in flight
+        :param return_exceptions: return exceptions as results instead of raising the first one
+        :return: results which are parallel to requests
+        """
+        import asyncio
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _acall(method: str, params: Optional[dict], session):
+            async with semaphore:
+                return await self.acall(method, params, session)
+
+        async def _gather(session=None):
+            return await asyncio.gather(
+                *[_acall(method, params, session) for method, params in requests],
+                return_exceptions=return_exceptions
+            )
+
+        if not self._can_send_async():
+            return await _gather()
+
+        async with self._provider.create_async_session() as session:
+            return await _gather(session)
+
+    def _can_send_async(self) -> bool:
+        return self._provider is not None and self._provider.can_create_async_session()
+
+    def get_bulk_status(self) -> dict:
+        return _to_bulk_status(self.batch_call(_BULK_STATUS_REQUESTS))
+
+    async def get_bulk_status_async(self) -> dict:
+        """Asynchronous version of get_bulk_status() which sends its calls concurrently
+        """
+        return _to_bulk_status(await self.gather_calls(_BULK_STATUS_REQUESTS))
+
+    def get_version(self, batch: Optional['CallBatch'] = None):
+        return self._call("getVersion", batch=batch)
+
+    def get_revision(self, batch: Optional['CallBatch'] = None):
+        return self._call("getRevision", batch=batch)
+
+    def get_service_config(self, batch: Optional['CallBatch'] = None, raw: bool = True):
+        """Service config which is fetched once and kept by the reader until clear_cache()
 
-    def get_step_costs(self):
-        return self._call(method="getStepCosts")
+        :param batch: batch to add the call to instead of sending it
+        :param raw: return the response as it is if True, otherwise ServiceConfig
+        """
+        if batch is not None:
+            return batch.add("getServiceConfig", converter=None if raw else ServiceConfig.from_dict)
+
+        if self._service_config is None:
+            self._service_config = self._call("getServiceConfig")
+
+        # Callers may modify the response
+        return dict(self._service_config) if raw else ServiceConfig.from_dict(self._service_config)
+
+    def get_score_status(self, address: Optional[str], batch: Optional['CallBatch'] = None) -> dict:
+        params = {"address": None if address is None else str(address)}
+        return self._call("getScoreStatus", params, batch)
+
+    def check_if_audit_enabled(self) -> bool:
+        return self.get_service_config(raw=False).audit
+
+    def get_step_costs(self, batch: Optional['CallBatch'] = None, raw: bool = True):
+        """
+        :param batch: batch to add the call to instead of sending it
+        :param raw: return the response as it is if True, otherwise StepCosts
+        """
+        if raw:
+            return self._call(method="getStepCosts", batch=batch)
+
+        return self._call_as("getStepCosts", StepCosts.from_dict, batch=batch)
 
-    def get_step_price(self):
-        return self._call(method="getStepPrice")
+    def get_step_price(self, batch: Optional['CallBatch'] = None) -> int:
+        return self._call_int(method="getStepPrice", batch=batch)
 
     def get_tx_result(self, tx_hash: str) -> dict:
         tx_result = self._icon_service.get_transaction_result(tx_hash)
         return tx_result
 
-    def get_max_step_limit(self, context_type: str) -> int:
+    def get_max_step_limit(self, context_type: str, batch: Optional['CallBatch'] = None) -> int:
         params = {"contextType": context_type}
-        return self._call("getMaxStepLimit", params)
+        return self._call_int("getMaxStepLimit", params, batch)
 
-    def is_deployer(self, address: str) -> int:
-        params = {"address": address}
-        return self._call("isDeployer", params)
+    def is_deployer(self, address: Optional[str], batch: Optional['CallBatch'] = None) -> int:
+        params = {"address": None if address is None else str(address)}
+        return self._call_as("isDeployer", _hex_to_flag, params, batch)
 
-    def is_in_score_black_list(self, address: str) -> int:
-        params = {"address": address}
-        return self._call("isInScoreBlackList", params)
+    def is_in_score_black_list(self, address: Optional[str], batch: Optional['CallBatch'] = None) -> int:
+        params = {"address": None if address is None else str(address)}
+        return self._call_as("isInScoreBlackList", _hex_to_flag, params, batch)
 
-    def is_in_import_white_list(self, import_stmt: str) -> int:
+    def is_in_import_white_list(self, import_stmt: str, batch: Optional['CallBatch'] = None) -> int:
         params = {"importStmt": import_stmt}
-        return self._call("isInImportWhiteList", params)
+        return self._call_as("isInImportWhiteList", _hex_to_flag, params, batch)
+
+
+class CallBatch(object):
+    """Calls which are deferred until execute() sends them in one JSON-RPC batch request
+
+    Getters of GovernanceReader add a call to it and return its index
+    when it is passed as their batch argument.
+    """
+
+    __slots__ = ("_reader", "_requests", "_converters")
+
+    def __init__(self, reader: GovernanceReader):
+        self._reader = reader
+        self._requests: List[Tuple[str, Optional[dict]]] = []
+        self._converters: List[Optional[Callable]] = []
+
+    def add(self, method: str, params: Optional[dict] = None, converter: Optional[Callable] = None) -> int:
+        """Add a call
+
+        :param method: governance method
+        :param params: governance method params
+        :param converter: function to convert the result of the call
+        :return: index of the result in the list which execute() returns
+        """
+        self._requests.append((method, params))
+        self._converters.append(converter)
+
+        return len(self._requests) - 1
+
+    def execute(self) -> list:
+        """Send all added calls and empty the batch
+
+        :return: results which are parallel to the added calls
+        """
+        requests, converters = self._requests, self._converters
+        self._requests, self._converters = [], []
+
+        if len(requests) == 0:
+            return []
+
+        results = self._reader.batch_call(requests)
+        return [ret if converter is None else converter(ret) for ret, converter in zip(results, converters)]
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+
+# Calls for GovernanceReader.get_bulk_status()
+_BULK_STATUS_REQUESTS = (
+    ("getRevision", None),
+    ("getServiceConfig", None),
+    ("getStepPrice", None),
+    ("getStepCosts", None),
+    ("getMaxStepLimit", {"contextType": "invoke"}),
+    ("getMaxStepLimit", {"contextType": "query"}),
+)
+
+
+def _to_bulk_status(results: list) -> dict:
+    """Step price and max step limits are converted to int like get_step_price() and get_max_step_limit()
+    """
+    revision, service_config, step_price, step_costs, invoke, query = results
+
+    return {
+        "revision": revision,
+        "serviceConfig": service_config,
+        "stepPrice": _hex_to_int(step_price),
+        "stepCosts": step_costs,
+        "maxStepLimit": {
+            "invoke": _hex_to_int(invoke),
+            "query": _hex_to_int(query)
+        }
+    }
 
 
 class GovernanceWriter(GovernanceListener):
-    def __init__(self, service, nid: int, owner):
+    __slots__ = ("_icon_service", "_owner", "_nid", "_provider", "_estimate_step_limit")
+
+    def __init__(self, service, nid: int, owner, provider: Optional['HTTPProvider'] = None,
+                 estimate_step_limit: bool = False):
+        """
+        :param provider: provider which service uses, to send transactions in a JSON-RPC batch request
+        :param estimate_step_limit: send transactions with the steps estimated by the node
+            instead of the fixed default step limits
+        """
         super().__init__()
 
         self._icon_service = service
         self._owner = owner
         self._nid = nid
+        self._provider = provider
+        self._estimate_step_limit = estimate_step_limit
+
+    @property
+    def owner(self):
+        return self._owner
+
+    def _call(self, method: str, params: dict, step_limit: Optional[int] = 0x10000000) -> str:
+        """
+        :param step_limit: None to send the transaction with the estimated steps
+        """
+        if self._estimate_step_limit:
+            step_limit = None
 
-    def _call(self, method: str, params: dict, step_limit: int = 0x10000000) -> str:
         tx_handler = self._create_tx_handler()
         return tx_handler.invoke(
             owner=self._owner,
@@ -242,59 +671,76 @@ class GovernanceWriter(GovernanceListener):
 
         :return: tx_hash
         """
-        path: str = os.path.join(score_path, "package.json")
-        if not os.path.isfile(path):
-            raise Exception(f"Invalid score path: {score_path}")
-
-        content: bytes = gen_deploy_data_content(score_path)
+        content: bytes = _get_score_content(score_path)
+        kwargs = {"step_limit": None} if self._estimate_step_limit else {}
 
         tx_handler = self._create_tx_handler()
-        ret = tx_handler.update(self._owner, GOVERNANCE_ADDRESS, content, estimate=estimate)
+        ret = tx_handler.update(self._owner, GOVERNANCE_ADDRESS, content, estimate=estimate, **kwargs)
 
         return ret
 
-    def accept_score(self, tx_hash: str) -> str:
-        method = "acceptScore"
-        params = {"txHash": tx_hash}
-
-        return self._call(method, params)
-
-    def reject_score(self, tx_hash: str, reason: str) -> str:
-        method = "rejectScore"
-        params = {"txHash": tx_hash, "reason": reason}
-
-        return self._call(method, params)
-
-    def add_auditor(self, address: str) -> str:
-        method = "addAuditor"
-        params = {"address": address}
+    def update_and_accept(self, score_path: str, step_limit: int = 0x70000000,
+                          accept_step_limit: int = 0x10000000) -> Union[List, bool]:
+        """Update governance SCORE and accept the update at once
+
+        The hash of the update transaction is computed locally from the signed transaction,
+        so acceptScore for it is signed without waiting for the response to the update.
+        Both transactions are sent in one JSON-RPC batch request if a provider is given,
+        otherwise one after another, and acceptScore is not sent if the update fails.
+        A node can still fail acceptScore if the update is not executed before it,
+        so check both transaction results.
+
+        With estimate_step_limit, the update is sent with its estimated steps.
+        acceptScore cannot be estimated before the update is executed, so it is always sent with accept_step_limit.
+
+        :param score_path: path of governance SCORE
+        :param step_limit: step limit of the update transaction
+        :param accept_step_limit: step limit of the acceptScore transaction
+        :return: False if on_send_request declines the update,
+            otherwise [update result, acceptScore result] each of which is tx_hash or JSONRPCException.
+            acceptScore result is None if it is declined or not sent
+        """
+        from iconsdk.exception import JSONRPCException
 
-        return self._call(method, params)
+        content: bytes = _get_score_content(score_path)
 
-    def remove_auditor(self, address: str) -> str:
-        method = "removeAuditor"
-        params = {"address": address}
+        tx_handler = self._create_tx_handler()
+        tx_build_helper = tx_handler.tx_build_helper
 
-        return self._call(method, params)
+        update_tx = tx_build_helper.update(
+            self._owner, GOVERNANCE_ADDRESS, content, step_limit=None if self._estimate_step_limit else step_limit)
+        signed_update_tx = tx_handler.sign(self._owner, update_tx)
+        if signed_update_tx is None:
+            return False
 
-    def set_revision(self, revision: int, name: str) -> str:
-        """Set revision to governance SCORE
+        accept_tx = tx_build_helper.invoke(
+            self._owner, GOVERNANCE_ADDRESS, "acceptScore", {"txHash": _get_tx_hash(signed_update_tx)},
+            step_limit=accept_step_limit)
+        signed_accept_tx = tx_handler.sign(self._owner, accept_tx)
 
-        :param revision:
-        :param name:
-        :return:
-        """
-        method = "setRevision"
-        params = {"code": revision, "name": name}
+        if self._provider is not None:
+            signed_txs = [signed_update_tx] if signed_accept_tx is None else [signed_update_tx, signed_accept_tx]
+            results = self._provider.make_batch_request(
+                [("icx_sendTransaction", signed_tx.signed_transaction_dict) for signed_tx in signed_txs],
+                return_exceptions=True
+            )
+            return results if len(results) == 2 else [results[0], None]
 
-        return self._call(method, params)
+        try:
+            update_result = self._icon_service.send_transaction(signed_update_tx)
+        except JSONRPCException as e:
+            # acceptScore for an update which has failed would fail as well
+            return [e, None]
 
-    def set_step_price(self, step_price: int) -> str:
+        if signed_accept_tx is None:
+            return [update_result, None]
 
-        method = "setStepPrice"
-        params = {"stepPrice": step_price}
+        try:
+            accept_result = self._icon_service.send_transaction(signed_accept_tx)
+        except JSONRPCException as e:
+            accept_result = e
 
-        return self._call(method, params)
+        return [update_result, accept_result]
 
     def set_step_cost(self, step_type: str, cost: int) -> str:
         """
@@ -304,12 +750,7 @@ class GovernanceWriter(GovernanceListener):
         :param cost:
         :return:
         """
-        step_types = (
-            "default", "contractCall", "contractCreate", "contractUpdate", "contractDestruct",
-            "contractSet", "get", "set", "replace", "delete", "input", "eventlog", "apiCall"
-        )
-
-        if step_type not in step_types:
+        if step_type not in _STEP_TYPES:
             raise ValueError(f"Invalid stepType: {step_type}")
 
         method = "setStepCost"
@@ -322,9 +763,7 @@ class GovernanceWriter(GovernanceListener):
 
     def set_max_step_limit(self, context_type: str, value: int) -> str:
 
-        context_types = ("invoke", "query")
-
-        if context_type not in context_types:
+        if context_type not in _CONTEXT_TYPES:
             raise ValueError(f"Invalid contextType: {context_type}")
 
         method = "setMaxStepLimit"
@@ -332,58 +771,153 @@ class GovernanceWriter(GovernanceListener):
 
         return self._call(method, params)
 
-    def add_deployer(self, address: str) -> str:
+    def get_tx_result(self, tx_hash: str) -> dict:
+        tx_result = self._icon_service.get_transaction_result(tx_hash)
+        return tx_result
 
-        method = "addDeployer"
-        params = {"address": address}
 
-        return self._call(method, params)
+# Writer methods which only pass their arguments to a governance method
+# (name, method, ((arg, arg type, param key), ...), summary of docstring)
+_INVOKE_METHODS = (
+    ("accept_score", "acceptScore", (("tx_hash", "str", "txHash"),),
+     "Accept a SCORE deploy transaction which is waiting for audit"),
+    ("reject_score", "rejectScore", (("tx_hash", "str", "txHash"), ("reason", "str", "reason")),
+     "Reject a SCORE deploy transaction which is waiting for audit"),
+    ("add_auditor", "addAuditor", (("address", "str", "address"),),
+     "Add an auditor who accepts or rejects SCORE deployments"),
+    ("remove_auditor", "removeAuditor", (("address", "str", "address"),),
+     "Remove an auditor"),
+    ("set_revision", "setRevision", (("revision", "int", "code"), ("name", "str", "name")),
+     "Set revision to governance SCORE"),
+    ("set_step_price", "setStepPrice", (("step_price", "int", "stepPrice"),),
+     "Set the price of a step in loop"),
+    ("add_deployer", "addDeployer", (("address", "str", "address"),),
+     "Allow an address to deploy SCOREs"),
+    ("remove_deployer", "removeDeployer", (("address", "str", "address"),),
+     "Disallow an address to deploy SCOREs"),
+    ("add_to_score_black_list", "addToScoreBlackList", (("address", "str", "address"),),
+     "Add a SCORE to the black list which blocks calls to it"),
+    ("remove_from_score_black_list", "removeFromScoreBlackList", (("address", "str", "address"),),
+     "Remove a SCORE from the black list"),
+    ("add_import_white_list", "addImportWhiteList", (("import_stmt", "str", "importStmt"),),
+     "Allow SCOREs to import a module"),
+    ("remove_import_white_list", "removeImportWhiteList", (("import_stmt", "str", "importStmt"),),
+     "Disallow SCOREs to import a module"),
+    ("update_service_config", "updateServiceConfig", (("service_flag", "int", "serviceFlag"),),
+     "Update the service flags of the network"),
+)
 
-    def remove_deployer(self, address: str) -> str:
+# Every name which goes into the source of a generated method
+_NAME_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _add_invoke_methods(cls, specs):
+    """Generate a method per spec which has the same signature as a hand-written one
+
+    ex) def add_auditor(self, address: str) -> str:
+            return self._call("addAuditor", {"address": address})
+    """
+    for name, method, args, summary in specs:
+        # Specs are validated once here, so a typo fails on import instead of on exec or on a call.
+        # Names are interpolated into the source, so only plain identifiers are allowed
+        if hasattr(cls, name):
+            raise ValueError(f"Duplicated method: {cls.__name__}.{name}")
+        names = (name, method, *(arg for arg, _, _ in args), *(key for _, _, key in args))
+        if not all(_NAME_PATTERN.fullmatch(n) for n in names):
+            raise ValueError(f"Invalid names: {cls.__name__}.{name}")
+        if not all(arg_type in ("str", "int") for _, arg_type, _ in args):
+            raise ValueError(f"Invalid argument types: {cls.__name__}.{name}")
+
+        arg_list = ", ".join(f"{arg}: {arg_type}" for arg, arg_type, _ in args)
+        params = ", ".join(f'"{key}": {arg}' for arg, _, key in args)
+        source = (
+            f"def {name}(self, {arg_list}) -> str:\n"
+            f"    return self._call(\"{method}\", {{{params}}})\n"
+        )
 
-        method = "removeDeployer"
-        params = {"address": address}
+        namespace = {}
+        exec(source, namespace)
 
-        return self._call(method, params)
+        func = namespace[name]
+        func.__module__ = cls.__module__
+        func.__qualname__ = f"{cls.__name__}.{name}"
+        func.__doc__ = "\n".join((
+            summary,
+            "",
+            *(f":param {arg}: {key} param of {method}" for arg, _, key in args),
+            ":return: tx_hash",
+        ))
+        setattr(cls, name, func)
 
-    def add_to_score_black_list(self, address: str) -> str:
 
-        method = "addToScoreBlackList"
-        params = {"address": address}
+_add_invoke_methods(GovernanceWriter, _INVOKE_METHODS)
 
-        return self._call(method, params)
 
-    def remove_from_score_black_list(self, address: str) -> str:
+def _get_score_content(score_path: str) -> bytes:
+    path: str = os.path.join(score_path, "package.json")
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
 
-        method = "removeFromScoreBlackList"
-        params = {"address": address}
+    if st is None or not stat.S_ISREG(st.st_mode):
+        raise Exception(f"Invalid score path: {score_path}")
 
-        return self._call(method, params)
+    return _get_deploy_data_content(score_path, os.path.abspath(score_path), _get_tree_signature(score_path))
 
-    def add_import_white_list(self, import_stmt: str) -> str:
 
-        method = "addImportWhiteList"
-        params = {"importStmt": import_stmt}
+def _get_tree_signature(score_path: str) -> tuple:
+    """Return what changes whenever any file under a SCORE directory is added, removed or modified
 
-        return self._call(method, params)
+    Stating every file is much cheaper than zipping them
+    """
+    signature = []
 
-    def remove_import_white_list(self, import_stmt: str) -> str:
+    for root, _, files in os.walk(score_path):
+        for file in files:
+            st = os.stat(os.path.join(root, file))
+            signature.append((root, file, st.st_mtime_ns, st.st_size))
 
-        method = "removeImportWhiteList"
-        params = {"importStmt": import_stmt}
+    signature.sort()
+    return tuple(signature)
 
-        return self._call(method, params)
 
-    def update_service_config(self, service_flag: int):
+def _get_tx_hash(signed_tx: 'SignedTransaction') -> str:
+    """Compute the hash of a signed transaction in the same way as ICON nodes do
 
-        method = "updateServiceConfig"
-        params = {"serviceFlag": service_flag}
+    It is the message hash which SignedTransaction signs
+    """
+    from hashlib import sha3_256
+    from iconsdk.libs.serializer import serialize
 
-        return self._call(method, params)
+    tx_dict = dict(signed_tx.signed_transaction_dict)
+    del tx_dict["signature"]
+
+    return f"0x{sha3_256(serialize(tx_dict)).hexdigest()}"
 
-    def get_tx_result(self, tx_hash: str) -> dict:
-        tx_result = self._icon_service.get_transaction_result(tx_hash)
-        return tx_result
+
+@functools.lru_cache(maxsize=4)
+def _get_deploy_data_content(score_path: str, abspath: str, signature: tuple) -> bytes:
+    """Zip a SCORE directory once per process
+
+    The zip is reused as long as no file in the directory is changed,
+    which helps a script that updates governance SCORE on several networks.
+
+    :param score_path: path of a SCORE directory which has package.json
+    :param abspath: absolute path of score_path as a relative one can refer to another directory
+    :param signature: signature of the files in the directory from _get_tree_signature()
+    """
+    from iconsdk.exception import ZipException
+    from iconsdk.libs.in_memory_zip import InMemoryZip
+
+    # The same as gen_deploy_data_content() except for the path check already done by the caller
+    try:
+        memory_zip = InMemoryZip()
+        memory_zip.zip_in_memory(score_path)
+    except ZipException:
+        raise ZipException("Can't zip SCORE contents")
+
+    return memory_zip.data
 
 
 def create_reader_by_args(args) -> GovernanceReader:
@@ -392,55 +926,127 @@ def create_reader_by_args(args) -> GovernanceReader:
 
     reader = create_reader(url, nid)
 
-    callback = functools.partial(_print_request, "Request")
-    reader.set_on_send_request(callback)
+    reader.set_on_send_request(_PRINT_REQUEST_CALLBACK)
 
     return reader
 
 
 def create_reader(url: str, nid: int) -> GovernanceReader:
-    icon_service = create_icon_service(url)
-    return GovernanceReader(icon_service, nid)
+    from iconsdk.icon_service import IconService
+
+    provider = create_provider(url)
+    icon_service = IconService(provider)
+    return GovernanceReader(icon_service, nid, provider=provider)
 
 
 def create_writer_by_args(args) -> GovernanceWriter:
     url: str = get_url(args.url)
     nid: int = args.nid
     keystore_path: str = args.keystore
-    password: str = args.password
+    password: Optional[str] = args.password
     yes: bool = args.yes
+    estimate_step_limit: bool = args.estimate_step_limit
 
-    if password is None:
-        password = getpass.getpass("> Password: ")
-
-    writer = create_writer(url, nid, keystore_path, password)
+    # If password is None, it is asked only when a transaction is about to be sent
+    writer = create_writer(url, nid, keystore_path, password, estimate_step_limit)
 
-    callback = functools.partial(_confirm_callback, yes=yes)
-    writer.set_on_send_request(callback)
+    callback = _accept_callback if yes else _confirm_callback
+    writer.set_on_send_request(functools.partial(_unlock_and_call, writer.owner, callback))
 
     return writer
 
 
-def create_writer(url: str, nid: int, keystore_path: str, password: str) -> GovernanceWriter:
-    icon_service = create_icon_service(url)
+def create_writer(url: str, nid: int, keystore_path: str, password: Optional[str],
+                  estimate_step_limit: bool = False) -> GovernanceWriter:
+    from iconsdk.icon_service import IconService
 
-    owner_wallet = KeyWallet.load(keystore_path, password)
-    return GovernanceWriter(icon_service, nid, owner_wallet)
+    provider = create_provider(url)
+    icon_service = IconService(provider)
 
+    owner_wallet = KeystoreWallet(keystore_path, password)
+    return GovernanceWriter(
+        icon_service, nid, owner_wallet, provider=provider, estimate_step_limit=estimate_step_limit)
 
-def create_icon_service(url: str) -> IconService:
+
+def create_icon_service(url: str) -> 'IconService':
+    from iconsdk.icon_service import IconService
+
+    return IconService(create_provider(url))
+
+
+def create_provider(url: str) -> 'HTTPProvider':
+    return _get_provider(_get_base_url(url))
+
+
+@functools.lru_cache(maxsize=16)
+def _get_base_url(url: str) -> str:
     url: str = get_url(url)
     o = urlparse(url)
 
-    return IconService(HTTPProvider(f"{o.scheme}://{o.netloc}", 3))
+    return f"{o.scheme}://{o.netloc}"
 
 
-def _confirm_callback(content: dict, yes: bool) -> bool:
-    _print_request("Request", content)
+@functools.lru_cache(maxsize=8)
+def _get_provider(base_url: str) -> 'HTTPProvider':
+    """Share one provider and its connection pool per node
+    """
+    from .provider import HTTPProvider
 
-    if not yes:
-        ret: str = input("> Continue? [Y/n]")
-        if ret == "n":
-            return False
+    return HTTPProvider(base_url, 3)
+
+
+def _hex_to_int(value: str) -> int:
+    # int(value, 16) accepts the "0x" prefix by itself and is faster than both
+    # int(value, 0) and int.from_bytes(bytes.fromhex(...))
+    return int(value, 16)
+
+
+# Results of the is* predicates which are either "0x0" or "0x1"
+_HEX_FLAGS = {"0x0": 0, "0x1": 1}
+
+
+def _hex_to_flag(value: str) -> int:
+    """_hex_to_int() with a fast path for "0x0" and "0x1"
+
+    A dict lookup takes about a third of the time int(value, 16) does
+    """
+    flag = _HEX_FLAGS.get(value)
+    return _hex_to_int(value) if flag is None else flag
+
+
+def _to_call(call_params: dict) -> 'Call':
+    """Convert icx_call params back to a Call for IconService.call()
+    """
+    from iconsdk.builder.call_builder import CallBuilder
+
+    data: dict = call_params["data"]
+
+    return CallBuilder() \
+        .from_(call_params["from"]) \
+        .to(call_params["to"]) \
+        .method(data["method"]) \
+        .params(data.get("params")) \
+        .build()
+
+
+def _accept_callback(content: dict) -> bool:
+    _PRINT_REQUEST_CALLBACK(content)
+    return True
+
+
+def _unlock_and_call(wallet: KeystoreWallet, callback: Callable[[dict], bool], content: dict) -> bool:
+    """Decrypt the keystore file before callback confirms a request,
+    so that a wrong password fails before the confirm prompt rather than after it
+    """
+    wallet.unlock()
+    return callback(content)
+
+
+def _confirm_callback(content: dict) -> bool:
+    _PRINT_REQUEST_CALLBACK(content)
+
+    ret: str = input("> Continue? [Y/n]")
+    if ret == "n":
+        return False
 
     return True
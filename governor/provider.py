@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from json.decoder import JSONDecodeError
+from typing import List, Optional, Tuple, Union
+
+import requests
+from iconsdk.exception import JSONRPCException, HTTPError
+from iconsdk.providers.http_provider import HTTPProvider as _HTTPProvider
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .constants import DEFAULT_BATCH_SIZE
+from .utils import import_httpx, import_orjson
+
+
+class HTTPProvider(_HTTPProvider):
+    """HTTPProvider which is able to send JSON-RPC 2.0 batch requests
+
+    All requests share one session so that keep-alive connections are reused
+    instead of opening a new TCP (and TLS) connection per request.
+    The session is an HTTP/2 enabled httpx.Client if httpx and h2 are installed,
+    otherwise a requests.Session.
+    """
+
+    _session = None
+
+    @property
+    def session(self):
+        if self._session is None:
+            self._session = _create_session()
+
+        return self._session
+
+    def _make_post_request(self, request_url: str, data, **kwargs):
+        kwargs.setdefault("timeout", _TIMEOUT)
+
+        if import_httpx() is not None:
+            return self.session.post(url=request_url, content=_dumps(data), **kwargs)
+
+        return self.session.post(url=request_url, data=_dumps(data), **kwargs)
+
+    @staticmethod
+    def can_create_async_session() -> bool:
+        """Whether either httpx and h2 or aiohttp is installed for create_async_session()
+        """
+        if import_httpx() is not None:
+            return True
+
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            return False
+
+        return True
+
+    @staticmethod
+    def create_async_session():
+        """Create a session to share among concurrent make_async_request() calls
+
+        :return: httpx.AsyncClient if httpx and h2 are installed, otherwise aiohttp.ClientSession
+        """
+        httpx = import_httpx()
+        if httpx is not None:
+            transport = httpx.AsyncHTTPTransport(**_get_httpx_transport_kwargs(httpx))
+            return httpx.AsyncClient(transport=transport, headers=DEFAULT_HEADERS)
+
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                "Async requests need httpx and h2, or aiohttp: "
+                "pip install governor[http2] or governor[async]") from None
+
+        return aiohttp.ClientSession()
+
+    async def make_async_request(self, method: str, params: Optional[dict] = None, session=None):
+        """Send a JSON-RPC request without blocking the event loop
+
+        :param method: JSON-RPC method
+        :param params: JSON-RPC params
+        :param session: a session created by create_async_session()
+        :return: result
+        """
+        rpc_dict = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "id": self._make_id()
+        }
+        if params:
+            rpc_dict["params"] = params
+
+        request_url = self._url.for_rpc(method.split("_")[0])
+        kwargs = self._get_request_kwargs()
+
+        if session is None:
+            async with self.create_async_session() as session:
+                return await _post_async(session, request_url, rpc_dict, **kwargs)
+
+        return await _post_async(session, request_url, rpc_dict, **kwargs)
+
+    @staticmethod
+    def _return_custom_response(response: requests.Response, full_response: bool = False):
+        content = _loads(response.content)
+        if full_response:
+            return content
+
+        if response.status_code < 400:
+            return content["result"]
+
+        _raise_if_error(content)
+        raise HTTPError(response.content.decode(), response.status_code)
+
+    def make_batch_request(
+            self, rpc_requests: List[Tuple[str, Optional[dict]]], batch_size: int = DEFAULT_BATCH_SIZE,
+            return_exceptions: bool = False) -> list:
+        """Send several JSON-RPC requests with as few HTTP round trips as possible
+
+        :param rpc_requests: list of (method, params)
+        :param batch_size: the max number of requests in one batch
+        :param return_exceptions: return JSONRPCException of a failed request as its result
+            instead of raising it, as the other requests in a batch may have succeeded
+        :return: results which are parallel to rpc_requests
+        """
+        batch_size = max(1, min(batch_size, DEFAULT_BATCH_SIZE))
+        results = []
+
+        for start in range(0, len(rpc_requests), batch_size):
+            results += self._make_batch_request(rpc_requests[start:start + batch_size], start, return_exceptions)
+
+        return results
+
+    def _make_batch_request(
+            self, rpc_requests: List[Tuple[str, Optional[dict]]], start: int, return_exceptions: bool) -> list:
+        rpc_list = []
+
+        for _id, (method, params) in enumerate(rpc_requests, start):
+            rpc_dict = {
+                "jsonrpc": "2.0",
+                "method": method,
+                "id": _id
+            }
+            if params:
+                rpc_dict["params"] = params
+
+            rpc_list.append(rpc_dict)
+
+        # All requests in a batch are supposed to share the same endpoint
+        request_url = self._url.for_rpc(rpc_requests[0][0].split("_")[0])
+        response = self._make_post_request(request_url, rpc_list, **self._get_request_kwargs())
+
+        try:
+            contents = _loads(response.content)
+        except JSONDecodeError:
+            raw_response = response.content.decode()
+            raise HTTPError(raw_response, response.status_code)
+
+        if not isinstance(contents, list):
+            # The whole batch has been rejected
+            _raise_if_error(contents)
+            raise HTTPError(response.content.decode(), response.status_code)
+
+        # Responses are not guaranteed to be in the same order as requests
+        contents_by_id = {content.get("id"): content for content in contents}
+
+        results = []
+        for _id in range(start, start + len(rpc_requests)):
+            content = contents_by_id.get(_id)
+            if content is None:
+                raise HTTPError(f"No response: id={_id}", response.status_code)
+
+            try:
+                _raise_if_error(content)
+            except JSONRPCException as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+            else:
+                results.append(content["result"])
+
+        return results
+
+
+async def _post_async(session, request_url: str, data: dict, **kwargs):
+    # Both httpx and aiohttp take a timeout in seconds
+    kwargs.setdefault("timeout", _TIMEOUT)
+
+    httpx = import_httpx()
+    if httpx is not None and isinstance(session, httpx.AsyncClient):
+        response = await session.post(request_url, content=_dumps(data), **kwargs)
+        content: bytes = response.content
+        status: int = response.status_code
+    else:
+        async with session.post(request_url, data=_dumps(data), **kwargs) as response:
+            content: bytes = await response.read()
+            status: int = response.status
+
+    try:
+        content = _loads(content)
+    except JSONDecodeError:
+        raise HTTPError(content.decode(), status)
+
+    _raise_if_error(content)
+    return content["result"]
+
+
+def _dumps(data) -> Union[str, bytes]:
+    """Serialize a request body with orjson if it is installed
+    """
+    orjson = import_orjson()
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            # orjson does not support integers which exceed 64 bits
+            pass
+
+    return json.dumps(data)
+
+
+def _loads(content: bytes):
+    """Deserialize a response body with orjson if it is installed
+
+    orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+    """
+    orjson = import_orjson()
+    if orjson is not None:
+        return orjson.loads(content)
+
+    return json.loads(content)
+
+
+DEFAULT_HEADERS = {"Content-Type": "application/json", "Connection": "keep-alive"}
+
+# Seconds to wait for a response before a request to an unresponsive node fails
+_TIMEOUT = 10
+
+# The number of retries when a connection fails
+# Requests which have reached a node are never retried not to send a transaction twice
+_CONNECT_RETRIES = 3
+
+
+def _get_httpx_transport_kwargs(httpx) -> dict:
+    return {
+        "http2": True,
+        # With HTTP/2 concurrent requests are multiplexed, so a few idle connections are kept alive
+        "limits": httpx.Limits(max_connections=32, max_keepalive_connections=8),
+        # httpx transports retry only on connection failures
+        "retries": _CONNECT_RETRIES,
+    }
+
+
+def _create_session():
+    # httpx with h2 installed lets concurrent requests share one HTTP/2 connection
+    httpx = import_httpx()
+    if httpx is not None:
+        transport = httpx.HTTPTransport(**_get_httpx_transport_kwargs(httpx))
+        return httpx.Client(transport=transport, headers=DEFAULT_HEADERS)
+
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+
+    retry = Retry(total=_CONNECT_RETRIES, read=False, status=False, backoff_factor=0.1)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
+def _raise_if_error(content: dict):
+    error = content.get("error")
+    if error is None:
+        return
+
+    raise JSONRPCException(error["message"], error["code"], error.get("data"))
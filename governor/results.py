@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+
+from .constants import STEP_TYPES
+
+# Flag names in getServiceConfig responses and the attributes of ServiceConfig which they map to
+_SERVICE_FLAGS = {
+    "FEE": "fee",
+    "AUDIT": "audit",
+    "DEPLOYER_WHITE_LIST": "deployer_white_list",
+    "SCORE_PACKAGE_VALIDATOR": "score_package_validator",
+}
+
+
+class StepCosts(object):
+    """Result of getStepCosts whose hex values are converted to int once
+
+    Attributes are named after step types.
+    A step type which the response does not have is None.
+    Step types which are unknown to this class are kept in extra, a read-only mapping, not to lose them
+    when a new revision of governance SCORE adds one.
+
+    URL: https://github.com/icon-project/governance#getstepcosts
+    """
+
+    __slots__ = STEP_TYPES + ("extra",)
+
+    def __init__(self, **costs: int):
+        for step_type in STEP_TYPES:
+            object.__setattr__(self, step_type, costs.pop(step_type, None))
+
+        object.__setattr__(self, "extra", MappingProxyType(costs))
+
+    @classmethod
+    def from_dict(cls, step_costs: Dict[str, str]) -> 'StepCosts':
+        """
+        :param step_costs: raw getStepCosts response ex) {"default": "0x186a0", ...}
+        """
+        return cls(**{key: int(value, 16) for key, value in step_costs.items()})
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, StepCosts) and self.to_dict() == other.to_dict()
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.to_dict().items()))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()})"
+
+    def to_dict(self) -> Dict[str, int]:
+        costs = {
+            step_type: getattr(self, step_type)
+            for step_type in STEP_TYPES if getattr(self, step_type) is not None
+        }
+        costs.update(self.extra)
+
+        return costs
+
+
+class ServiceConfig(object):
+    """Result of getServiceConfig whose flags are converted to bool once
+
+    Attributes are named after flags in snake case ex) config.audit, config.deployer_white_list
+    A flag which the response does not have is False.
+    Flags which are unknown to this class are kept in extra, a read-only mapping, by their names in the response.
+    """
+
+    __slots__ = tuple(_SERVICE_FLAGS.values()) + ("extra",)
+
+    def __init__(self, fee: bool = False, audit: bool = False,
+                 deployer_white_list: bool = False, score_package_validator: bool = False,
+                 extra: Optional[Mapping[str, bool]] = None):
+        object.__setattr__(self, "fee", fee)
+        object.__setattr__(self, "audit", audit)
+        object.__setattr__(self, "deployer_white_list", deployer_white_list)
+        object.__setattr__(self, "score_package_validator", score_package_validator)
+        object.__setattr__(self, "extra", MappingProxyType(dict(extra) if extra else {}))
+
+    @classmethod
+    def from_dict(cls, service_config: Dict[str, str]) -> 'ServiceConfig':
+        """
+        :param service_config: raw getServiceConfig response ex) {"AUDIT": "0x1", ...}
+        """
+        flags = {}
+        extra = {}
+
+        for key, value in service_config.items():
+            attr: Optional[str] = _SERVICE_FLAGS.get(key)
+            if attr is None:
+                extra[key] = value == "0x1"
+            else:
+                flags[attr] = value == "0x1"
+
+        return cls(**flags, extra=extra)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ServiceConfig) and self.to_dict() == other.to_dict()
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.to_dict().items()))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()})"
+
+    def to_dict(self) -> Dict[str, bool]:
+        """
+        :return: flags by their names in getServiceConfig responses
+        """
+        flags = {key: getattr(self, attr) for key, attr in _SERVICE_FLAGS.items()}
+        flags.update(self.extra)
+
+        return flags
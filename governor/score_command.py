@@ -14,36 +14,61 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Union
+from typing import Callable, List, Optional, Union
 
-from .governance import create_writer_by_args, create_reader_by_args
+from .governance import GovernanceWriter, create_writer_by_args, create_reader_by_args
 from .utils import print_response
 
 
+# (command name, GovernanceWriter method, argument name, argument type, argument help)
+# Commands are split into tables by where they appear among the other subcommands in `governor -h`
+_AUDIT_COMMANDS = (
+    ("acceptScore", "accept_score", "tx_hash", str,
+     "txHash ex) 0xe2a8e2483736ba8793bebebc30673aa4fb7662763bcdc7b0d4d8a163a79c9e20"),
+)
+_LIST_COMMANDS = (
+    ("addAuditor", "add_auditor", "address", str, ""),
+    ("removeAuditor", "remove_auditor", "address", str, ""),
+    ("addDeployer", "add_deployer", "address", str, ""),
+    ("removeDeployer", "remove_deployer", "address", str, ""),
+    ("addToScoreBlackList", "add_to_score_black_list", "address", str, ""),
+    ("removeFromScoreBlackList", "remove_from_score_black_list", "address", str, ""),
+    ("addImportWhiteList", "add_import_white_list", "import_stmt", str, ""),
+    ("removeImportWhiteList", "remove_import_white_list", "import_stmt", str, ""),
+)
+_SERVICE_CONFIG_COMMANDS = (
+    ("updateServiceConfig", "update_service_config", "service_flag", int, ""),
+)
+_INVOKE_COMMANDS = _AUDIT_COMMANDS + _LIST_COMMANDS + _SERVICE_CONFIG_COMMANDS
+
+# (command name, GovernanceReader method, argument name)
+_QUERY_COMMANDS = (
+    ("isDeployer", "is_deployer", "address"),
+    ("isInScoreBlackList", "is_in_score_black_list", "address"),
+    # todo: governor 입력시 isImportWhiteList 줄바꿈 현상 확인
+    ("isInImportWhiteList", "is_in_import_white_list", "import_stmt"),
+)
+
+
 def init(sub_parser, common_parent_parser, invoke_parent_parser):
     _init_for_update(sub_parser, common_parent_parser, invoke_parent_parser)
-    _init_for_accept_score(sub_parser, common_parent_parser, invoke_parent_parser)
+    _init_for_invoke_commands(sub_parser, common_parent_parser, invoke_parent_parser, _AUDIT_COMMANDS)
     _init_for_reject_score(sub_parser, common_parent_parser, invoke_parent_parser)
 
-    _init_for_add_auditor(sub_parser, common_parent_parser, invoke_parent_parser)
-    _init_for_remove_auditor(sub_parser, common_parent_parser, invoke_parent_parser)
-
-    _init_for_add_deployer(sub_parser, common_parent_parser, invoke_parent_parser)
-    _init_for_remove_deployer(sub_parser, common_parent_parser, invoke_parent_parser)
-
-    _init_for_add_to_score_black_list(sub_parser, common_parent_parser, invoke_parent_parser)
-    _init_for_remove_from_score_black_list(sub_parser, common_parent_parser, invoke_parent_parser)
-
-    _init_for_add_import_white_list(sub_parser, common_parent_parser, invoke_parent_parser)
-    _init_for_remove_import_white_list(sub_parser, common_parent_parser, invoke_parent_parser)
+    _init_for_invoke_commands(sub_parser, common_parent_parser, invoke_parent_parser, _LIST_COMMANDS)
 
     _init_for_get_score_status(sub_parser, common_parent_parser)
     _init_for_get_service_config(sub_parser, common_parent_parser)
-    _init_for_update_service_config(sub_parser, common_parent_parser, invoke_parent_parser)
+    _init_for_invoke_commands(sub_parser, common_parent_parser, invoke_parent_parser, _SERVICE_CONFIG_COMMANDS)
+
+    for name, method, arg_name in _QUERY_COMMANDS:
+        _init_for_query(sub_parser, common_parent_parser, name, method, arg_name)
+
 
-    _init_for_is_deployer(sub_parser, common_parent_parser)
-    _init_for_is_in_score_black_list(sub_parser, common_parent_parser)
-    _init_for_is_in_import_white_list(sub_parser, common_parent_parser)
+def _init_for_invoke_commands(sub_parser, common_parent_parser, invoke_parent_parser, commands: tuple):
+    for name, method, arg_name, arg_type, arg_help in commands:
+        _init_for_invoke(
+            sub_parser, common_parent_parser, invoke_parent_parser, name, method, arg_name, arg_type, arg_help)
 
 
 def _init_for_update(sub_parser, common_parent_parser, invoke_parent_parser):
@@ -61,22 +86,33 @@ def _init_for_update(sub_parser, common_parent_parser, invoke_parent_parser):
         nargs="?",
         help="path where governance SCORE is located\nex) ./governance"
     )
-    score_parser.add_argument(
+    group = score_parser.add_mutually_exclusive_group()
+    group.add_argument(
         "--estimate",
         action="store_true",
         default=False,
         required=False,
         help="estimate step"
     )
+    group.add_argument(
+        "--accept",
+        action="store_true",
+        default=False,
+        required=False,
+        help="send acceptScore for the update in the same batch request"
+    )
 
     score_parser.set_defaults(func=_update_governance_score)
 
 
-def _update_governance_score(args) -> Union[int, str]:
+def _update_governance_score(args) -> Union[int, str, List]:
     score_path: str = args.score_path
     estimate: bool = args.estimate
 
     writer = create_writer_by_args(args)
+    if args.accept:
+        return _update_and_accept(writer, score_path)
+
     ret = writer.update(score_path, estimate)
 
     if estimate:
@@ -97,18 +133,41 @@ def _init_for_get_score_status(sub_parser, common_parent_parser):
     score_parser.add_argument(
         "address",
         type=str,
-        nargs="?",
-        help="SCORE address ex) cx8a96c0dcf0567635309809d391908c32fbca5317"
+        nargs="*",
+        help="SCORE addresses ex) cx8a96c0dcf0567635309809d391908c32fbca5317"
     )
 
     score_parser.set_defaults(func=_get_score_status)
 
 
 def _get_score_status(args) -> int:
-    address: str = args.address
+    # No address is sent as null as before several addresses were accepted
+    # Repeated addresses are queried once as the result is keyed by address
+    addresses: List[Optional[str]] = list(dict.fromkeys(args.address)) or [None]
 
     reader = create_reader_by_args(args)
-    result: dict = reader.get_score_status(address)
+
+    if len(addresses) == 1:
+        result: dict = reader.get_score_status(addresses[0])
+    else:
+        import asyncio
+
+        # Query the status of each SCORE concurrently
+        requests = [("getScoreStatus", {"address": address}) for address in addresses]
+        results: list = asyncio.run(reader.gather_calls(requests, return_exceptions=True))
+
+        # JSONRPCException derives from BaseException, not Exception
+        result = {}
+        failed = False
+        for address, ret in zip(addresses, results):
+            if isinstance(ret, BaseException):
+                failed = True
+                ret = str(ret)
+            result[address] = ret
+
+        print_response(result)
+        return 1 if failed else 0
+
     print_response(result)
 
     return 0
@@ -134,56 +193,17 @@ def _get_service_config(args) -> int:
     return 0
 
 
-def _init_for_update_service_config(sub_parser, common_parent_parser, invoke_parent_parser):
-    name = "updateServiceConfig"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser, invoke_parent_parser],
-        help=desc)
-
-    score_parser.add_argument(
-        "service_flag",
-        type=int,
-        nargs="?",
-        help=""
-    )
-
-    score_parser.set_defaults(func=_update_service_config)
-
-
-def _update_service_config(args):
-    service_flag: int = args.service_flag
-
-    writer = create_writer_by_args(args)
-    return writer.update_service_config(service_flag)
+def _update_and_accept(writer: GovernanceWriter, score_path: str) -> Union[int, List]:
+    results = writer.update_and_accept(score_path)
+    if results is False:
+        return 0
 
+    update_result, accept_result = results
+    print_response({"update": str(update_result), "acceptScore": str(accept_result)})
 
-def _init_for_accept_score(sub_parser, common_parent_parser, invoke_parent_parser):
-    name = "acceptScore"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser, invoke_parent_parser],
-        help=desc)
-
-    score_parser.add_argument(
-        "tx_hash",
-        type=str,
-        nargs="?",
-        help="txHash ex) 0xe2a8e2483736ba8793bebebc30673aa4fb7662763bcdc7b0d4d8a163a79c9e20"
-    )
-
-    score_parser.set_defaults(func=_accept_score)
-
-
-def _accept_score(args) -> str:
-    tx_hash: str = args.tx_hash
-
-    writer = create_writer_by_args(args)
-    return writer.accept_score(tx_hash)
+    # Both tx hashes mean only that the node has received them.
+    # acceptScore still fails if it is executed before the update, so the result of each is printed
+    return results
 
 
 def _init_for_reject_score(sub_parser, common_parent_parser, invoke_parent_parser):
@@ -220,138 +240,8 @@ def _reject_score(args) -> str:
     return writer.reject_score(tx_hash, reason)
 
 
-def _init_for_add_auditor(sub_parser, common_parent_parser, invoke_parent_parser):
-    name = "addAuditor"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser, invoke_parent_parser],
-        help=desc)
-
-    score_parser.add_argument(
-        "address",
-        type=str,
-        nargs="?",
-        help=""
-    )
-
-    score_parser.set_defaults(func=_add_auditor)
-
-
-def _add_auditor(args) -> str:
-    address: str = args.address
-
-    writer = create_writer_by_args(args)
-    return writer.add_auditor(address)
-
-
-def _init_for_remove_auditor(sub_parser, common_parent_parser, invoke_parent_parser):
-    name = "removeAuditor"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser, invoke_parent_parser],
-        help=desc)
-
-    score_parser.add_argument(
-        "address",
-        type=str,
-        nargs="?",
-        help=""
-    )
-
-    score_parser.set_defaults(func=_remove_auditor)
-
-
-def _remove_auditor(args) -> str:
-    address: str = args.address
-
-    writer = create_writer_by_args(args)
-    return writer.remove_auditor(address)
-
-
-def _init_for_add_deployer(sub_parser, common_parent_parser, invoke_parent_parser):
-    name = "addDeployer"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser, invoke_parent_parser],
-        help=desc)
-
-    score_parser.add_argument(
-        "address",
-        type=str,
-        nargs="?",
-        help=""
-    )
-
-    score_parser.set_defaults(func=_add_deployer)
-
-
-def _add_deployer(args) -> str:
-    address: str = args.address
-
-    writer = create_writer_by_args(args)
-    return writer.add_deployer(address)
-
-
-def _init_for_remove_deployer(sub_parser, common_parent_parser, invoke_parent_parser):
-    name = "removeDeployer"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser, invoke_parent_parser],
-        help=desc)
-
-    score_parser.add_argument(
-        "address",
-        type=str,
-        nargs="?",
-        help=""
-    )
-
-    score_parser.set_defaults(func=_remove_deployer)
-
-
-def _remove_deployer(args) -> str:
-    address: str = args.address
-
-    writer = create_writer_by_args(args)
-    return writer.remove_deployer(address)
-
-
-def _init_for_add_to_score_black_list(sub_parser, common_parent_parser, invoke_parent_parser):
-    name = "addToScoreBlackList"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser, invoke_parent_parser],
-        help=desc)
-
-    score_parser.add_argument(
-        "address",
-        type=str,
-        nargs="?",
-        help=""
-    )
-
-    score_parser.set_defaults(func=_add_to_score_black_list)
-
-
-def _add_to_score_black_list(args) -> str:
-    address: str = args.address
-
-    writer = create_writer_by_args(args)
-    return writer.add_to_score_black_list(address)
-
-
-def _init_for_remove_from_score_black_list(sub_parser, common_parent_parser, invoke_parent_parser):
-    name = "removeFromScoreBlackList"
+def _init_for_invoke(sub_parser, common_parent_parser, invoke_parent_parser,
+                     name: str, method: str, arg_name: str, arg_type: type, arg_help: str):
     desc = f"{name} command"
 
     score_parser = sub_parser.add_parser(
@@ -360,76 +250,25 @@ def _init_for_remove_from_score_black_list(sub_parser, common_parent_parser, inv
         help=desc)
 
     score_parser.add_argument(
-        "address",
-        type=str,
+        arg_name,
+        type=arg_type,
         nargs="?",
-        help=""
+        help=arg_help
     )
 
-    score_parser.set_defaults(func=_remove_from_score_black_list)
+    score_parser.set_defaults(func=_create_invoke_handler(method, arg_name))
 
 
-def _remove_from_score_black_list(args) -> str:
-    address: str = args.address
+def _create_invoke_handler(method: str, arg_name: str) -> Callable:
+    def handler(args) -> str:
+        writer = create_writer_by_args(args)
+        return getattr(writer, method)(getattr(args, arg_name))
 
-    writer = create_writer_by_args(args)
-    return writer.remove_from_score_black_list(address)
+    handler.__name__ = f"_{method}"
+    return handler
 
 
-def _init_for_add_import_white_list(sub_parser, common_parent_parser, invoke_parent_parser):
-    name = "addImportWhiteList"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser, invoke_parent_parser],
-        help=desc)
-
-    score_parser.add_argument(
-        "import_stmt",
-        type=str,
-        nargs="?",
-        help=""
-    )
-
-    score_parser.set_defaults(func=_add_import_white_list)
-
-
-def _add_import_white_list(args) -> str:
-    import_stmt: str = args.import_stmt
-
-    writer = create_writer_by_args(args)
-    return writer.add_import_white_list(import_stmt)
-
-
-def _init_for_remove_import_white_list(sub_parser, common_parent_parser, invoke_parent_parser):
-    name = "removeImportWhiteList"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser, invoke_parent_parser],
-        help=desc)
-
-    score_parser.add_argument(
-        "import_stmt",
-        type=str,
-        nargs="?",
-        help=""
-    )
-
-    score_parser.set_defaults(func=_remove_import_white_list)
-
-
-def _remove_import_white_list(args) -> str:
-    import_stmt: str = args.import_stmt
-
-    writer = create_writer_by_args(args)
-    return writer.remove_import_white_list(import_stmt)
-
-
-def _init_for_is_deployer(sub_parser, common_parent_parser):
-    name = "isDeployer"
+def _init_for_query(sub_parser, common_parent_parser, name: str, method: str, arg_name: str):
     desc = f"{name} command"
 
     score_parser = sub_parser.add_parser(
@@ -438,85 +277,23 @@ def _init_for_is_deployer(sub_parser, common_parent_parser):
         help=desc)
 
     score_parser.add_argument(
-        "address",
+        arg_name,
         type=str,
         nargs="?",
         help=""
     )
 
-    score_parser.set_defaults(func=_is_deployer)
-
+    score_parser.set_defaults(func=_create_query_handler(method, arg_name))
 
-def _is_deployer(args) -> int:
-    address: str = args.address
 
-    reader = create_reader_by_args(args)
-    is_deployer: str = reader.is_deployer(address)
-    is_deployer = int(is_deployer, 16)
+def _create_query_handler(method: str, arg_name: str) -> Callable:
+    def handler(args) -> int:
+        reader = create_reader_by_args(args)
+        ret: int = getattr(reader, method)(getattr(args, arg_name))
 
-    print_response(is_deployer)
+        print_response(ret)
 
-    return 0
-
-
-def _init_for_is_in_score_black_list(sub_parser, common_parent_parser):
-    name = "isInScoreBlackList"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser],
-        help=desc)
-
-    score_parser.add_argument(
-        "address",
-        type=str,
-        nargs="?",
-        help=""
-    )
+        return 0
 
-    score_parser.set_defaults(func=_is_in_score_black_list)
-
-
-def _is_in_score_black_list(args) -> int:
-    address: str = args.address
-
-    reader = create_reader_by_args(args)
-    is_in_score_black_list: str = reader.is_in_score_black_list(address)
-    is_in_score_black_list = int(is_in_score_black_list, 16)
-
-    print_response(is_in_score_black_list)
-
-    return 0
-
-
-def _init_for_is_in_import_white_list(sub_parser, common_parent_parser):
-    name = "isInImportWhiteList"
-    desc = f"{name} command"
-
-    # todo: governor 입력시 isImportWhiteList 줄바꿈 현상 확인
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser],
-        help=desc)
-
-    score_parser.add_argument(
-        "import_stmt",
-        type=str,
-        nargs="?",
-        help=""
-    )
-
-    score_parser.set_defaults(func=_is_in_import_white_list)
-
-
-def _is_in_import_white_list(args) -> int:
-    import_stmt: str = args.import_stmt
-
-    reader = create_reader_by_args(args)
-    is_in_import_white_list: str = reader.is_in_import_white_list(import_stmt)
-    is_in_import_white_list = int(is_in_import_white_list, 16)
-
-    print_response(is_in_import_white_list)
-
-    return 0
+    handler.__name__ = f"_{method}"
+    return handler
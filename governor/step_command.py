@@ -151,13 +151,9 @@ def _get_step_costs(args) -> int:
 
 
 def _convert_hex_to_int(step_costs: dict) -> dict:
-    for key in step_costs:
-        value: str = step_costs[key]
-        assert isinstance(value, str)
-
-        step_costs[key] = int(value, 16)
-
-    return step_costs
+    # Leave step_costs untouched as it can be shared with the reader's cache
+    # int() raises TypeError for a non-str value, so no isinstance check is needed
+    return {key: int(value, 16) for key, value in step_costs.items()}
 
 
 def _init_for_get_step_price(sub_parser, common_parent_parser):
@@ -174,9 +170,9 @@ def _init_for_get_step_price(sub_parser, common_parent_parser):
 
 def _get_step_price(args) -> int:
     reader = create_reader_by_args(args)
-    step_price: str = reader.get_step_price()
+    step_price: int = reader.get_step_price()
 
-    print_response(f"stepPrice: {int(step_price, 16)}")
+    print_response(f"stepPrice: {step_price}")
 
     return 0
 
@@ -204,10 +200,9 @@ def _get_max_step_limit(args) -> int:
     context_type: str = args.context_type
 
     reader = create_reader_by_args(args)
-    max_step_limit: dict = reader.get_max_step_limit(context_type)
-    max_step_limit = int(max_step_limit, 16)
+    max_step_limit: int = reader.get_max_step_limit(context_type)
 
-    # print_response(f"MaxStepLimit : {int(max_step_limit, 16)}")
+    # print_response(f"MaxStepLimit : {max_step_limit}")
     print_response(max_step_limit)
 
     return 0
@@ -14,6 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import importlib
 import json
 from typing import TYPE_CHECKING, Union, Optional
 from urllib.parse import urlparse
@@ -74,6 +76,7 @@ def get_predefined_url(name: str) -> Optional[str]:
     return PREDEFINED_URLS.get(name)
 
 
+@functools.lru_cache(maxsize=16)
 def get_url(url: str) -> str:
     predefined_url: str = get_predefined_url(url)
 
@@ -84,3 +87,32 @@ def get_url(url: str) -> str:
         raise ValueError(f"Invalid url: {url}")
 
     return url
+
+
+@functools.lru_cache(maxsize=1)
+def import_orjson():
+    """Import orjson on first use as it takes several milliseconds to import
+
+    :return: orjson module or None if it is not installed
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    return orjson
+
+
+@functools.lru_cache(maxsize=1)
+def import_httpx():
+    """Import httpx on first use, only if h2 is also installed for HTTP/2
+
+    :return: httpx module or None if either of them is not installed
+    """
+    try:
+        importlib.import_module("h2")
+        import httpx
+    except ImportError:
+        return None
+
+    return httpx
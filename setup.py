@@ -25,6 +25,12 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     packages=setuptools.find_packages(),
+    python_requires=">=3.8",
+    extras_require={
+        "async": ["aiohttp"],
+        "http2": ["httpx", "h2"],
+        "orjson": ["orjson"],
+    },
     classifiers=[
         "License :: OSI Approved :: Apache License",
         "Operating System :: OS Independent",
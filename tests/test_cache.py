@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+from governor.cache import RPCCache, RPCCacheConfig
+
+
+class TestRPCCache(unittest.TestCase):
+    def test_make_key(self):
+        key0 = RPCCache.make_key("getMaxStepLimit", {"a": 1, "b": 2})
+        key1 = RPCCache.make_key("getMaxStepLimit", {"b": 2, "a": 1})
+        assert key0 == key1
+
+        assert RPCCache.make_key("getRevision", None) == RPCCache.make_key("getRevision", {})
+        assert RPCCache.make_key("getRevision", None) != RPCCache.make_key("getVersion", None)
+
+        key0 = RPCCache.make_key("setRevision", {"code": 2 ** 256, "name": "1.0.0"})
+        key1 = RPCCache.make_key("setRevision", {"name": "1.0.0", "code": 2 ** 256})
+        assert key0 == key1
+
+    def test_lru(self):
+        cache = RPCCache(RPCCacheConfig(maxsize=2))
+
+        cache.put("a", 0)
+        cache.put("b", 1)
+        assert cache.get("a") == 0
+
+        # "b" is the least recently used one
+        cache.put("c", 2)
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 0
+        assert cache.get("c") == 2
+
+    def test_ttl(self):
+        cache = RPCCache(RPCCacheConfig(ttl=10))
+
+        with mock.patch("time.monotonic", return_value=100.0):
+            cache.put("a", 0)
+
+        with mock.patch("time.monotonic", return_value=109.0):
+            assert cache.get("a") == 0
+
+        with mock.patch("time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
@@ -0,0 +1,691 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import inspect
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from iconsdk.exception import JSONRPCException
+
+from governor.cache import RPCCacheConfig
+from governor.constants import EOA_ADDRESS, GOVERNANCE_ADDRESS
+from governor.governance import (
+    _BULK_STATUS_REQUESTS, GovernanceReader, GovernanceWriter, KeystoreWallet, TxBuildHelper, create_provider
+)
+
+
+class TestGovernanceReader(unittest.TestCase):
+    def setUp(self):
+        self.service = mock.Mock()
+        self.provider = mock.Mock()
+
+        self.reader = GovernanceReader(self.service, 3, provider=self.provider)
+        self.reader.set_on_send_request(lambda content: None)
+
+    def test_batch_call(self):
+        self.provider.make_batch_request.return_value = ["0x1", "0x2"]
+
+        results = self.reader.batch_call([
+            ("getRevision", None),
+            ("getMaxStepLimit", {"contextType": "invoke"}),
+        ])
+        assert results == ["0x1", "0x2"]
+
+        requests, batch_size = self.provider.make_batch_request.call_args[0]
+        assert len(requests) == 2
+
+        method, params = requests[1]
+        assert method == "icx_call"
+        assert params["to"] == GOVERNANCE_ADDRESS
+        assert params["dataType"] == "call"
+        assert params["data"] == {"method": "getMaxStepLimit", "params": {"contextType": "invoke"}}
+        self.provider.make_request.assert_not_called()
+
+    def test_batch(self):
+        self.provider.make_batch_request.return_value = ["1.0.0", "0x2e90edd00", "0x9502f900"]
+
+        batch = self.reader.create_batch()
+        assert self.reader.get_version(batch=batch) == 0
+        assert self.reader.get_step_price(batch=batch) == 1
+        assert self.reader.get_max_step_limit("invoke", batch=batch) == 2
+        self.provider.make_batch_request.assert_not_called()
+
+        assert batch.execute() == ["1.0.0", 12500000000, 2500000000]
+        assert self.provider.make_batch_request.call_count == 1
+        assert len(batch) == 0
+        self.provider.make_request.assert_not_called()
+
+    def test_get_bulk_status(self):
+        self.provider.make_batch_request.return_value = [
+            {"code": "0x6"}, {"AUDIT": "0x1"}, "0x2e90edd00", {"default": "0x186a0"}, "0x9502f900", "0x9502f90"
+        ]
+
+        reader = GovernanceReader(self.service, 3, provider=self.provider, cache_config=RPCCacheConfig(enabled=True))
+        reader.set_on_send_request(lambda content: None)
+
+        status = reader.get_bulk_status()
+        assert self.provider.make_batch_request.call_count == 1
+        assert status["stepPrice"] == 12500000000
+        assert status["maxStepLimit"] == {"invoke": 2500000000, "query": 156250000}
+        # The results of the batch are cached
+        assert status["stepPrice"] == reader.get_step_price()
+        self.provider.make_request.assert_not_called()
+
+    def test_get_bulk_status_with_callback(self):
+        self.provider.make_batch_request.return_value = [
+            {"code": "0x6"}, {"AUDIT": "0x1"}, "0x2e90edd00", {"default": "0x186a0"}, "0x9502f900", "0x9502f90"
+        ]
+
+        def tamper(content: dict):
+            if "params" in content["data"]:
+                content["data"]["params"]["contextType"] = "tampered"
+
+        # A callback which modifies the params of a request does not change the shared request table
+        self.reader.set_on_send_request(tamper)
+        self.reader.get_bulk_status()
+        self.reader.set_on_send_request(lambda content: None)
+        self.reader.get_bulk_status()
+
+        requests, _ = self.provider.make_batch_request.call_args[0]
+        assert [params["data"].get("params") for _, params in requests][-2:] == [
+            {"contextType": "invoke"}, {"contextType": "query"}
+        ]
+
+    def test_get_bulk_status_async(self):
+        results = {
+            "getRevision": {"code": "0x6"}, "getServiceConfig": {"AUDIT": "0x1"},
+            "getStepPrice": "0x2e90edd00", "getStepCosts": {"default": "0x186a0"},
+        }
+
+        async def make_async_request(method, params, session):
+            data = params["data"]
+            if data["method"] == "getMaxStepLimit":
+                return {"invoke": "0x9502f900", "query": "0x9502f90"}[data["params"]["contextType"]]
+            return results[data["method"]]
+
+        self.provider.make_async_request.side_effect = make_async_request
+        self.provider.create_async_session.return_value = mock.MagicMock()
+
+        status = asyncio.run(self.reader.get_bulk_status_async())
+        assert status["stepPrice"] == 12500000000
+        assert status["maxStepLimit"] == {"invoke": 2500000000, "query": 156250000}
+        self.provider.make_batch_request.assert_not_called()
+
+    def test_slots(self):
+        assert not hasattr(self.reader, "__dict__")
+
+    def test_call(self):
+        self.provider.make_request.return_value = "1.0.0"
+        assert self.reader.get_version() == "1.0.0"
+
+        method, params = self.provider.make_request.call_args[0]
+        expected = {
+            "from": EOA_ADDRESS,
+            "to": GOVERNANCE_ADDRESS,
+            "dataType": "call",
+            "data": {"method": "getVersion"}
+        }
+        assert method == "icx_call"
+        assert params == expected
+
+    def test_call_without_address(self):
+        self.provider.make_request.return_value = "0x0"
+
+        for call in (self.reader.is_deployer, self.reader.is_in_score_black_list, self.reader.get_score_status):
+            call(None)
+            _, params = self.provider.make_request.call_args[0]
+            assert params["data"]["params"] == {"address": None}
+
+    def test_create_call_params(self):
+        params = self.reader._create_call_params("getMaxStepLimit", {"contextType": "invoke"})
+        assert params["data"] == {"method": "getMaxStepLimit", "params": {"contextType": "invoke"}}
+        assert self.reader._create_call_params("getStepPrice") == {
+            "from": EOA_ADDRESS, "to": GOVERNANCE_ADDRESS, "dataType": "call", "data": {"method": "getStepPrice"}
+        }
+
+    def test_call_params_modified_after_call(self):
+        reader = GovernanceReader(self.service, 3, provider=self.provider, cache_config=RPCCacheConfig(enabled=False))
+        reader.set_on_send_request(lambda content: None)
+        self.provider.make_request.return_value = "0x1"
+
+        params = {"address": "hxaaaa"}
+        reader._call("isDeployer", params)
+        params["address"] = "hxbbbb"
+
+        reader.is_deployer("hxaaaa")
+        assert self.provider.make_request.call_args[0][1]["data"]["params"] == {"address": "hxaaaa"}
+
+        # A callback which modifies the params does not affect later calls
+        reader.set_on_send_request(lambda content: content["data"].update(method="foo"))
+        reader.get_version()
+        reader.set_on_send_request(lambda content: None)
+        reader.get_version()
+        assert self.provider.make_request.call_args[0][1]["data"] == {"method": "getVersion"}
+
+        # Neither does a callback which modifies the nested params of a governance method
+        reader.set_on_send_request(lambda content: content["data"]["params"].update(address="hxcccc"))
+        params = {"address": "hxaaaa"}
+        reader._call("isDeployer", params)
+        assert params == {"address": "hxaaaa"}
+
+        self.provider.make_batch_request.return_value = [
+            {"code": "0x6"}, {"AUDIT": "0x1"}, "0x2e90edd00", {"default": "0x186a0"}, "0x9502f900", "0x9502f90"
+        ]
+        reader.set_on_send_request(lambda content: content["data"].get("params", {}).update(contextType="tampered"))
+        reader.get_bulk_status()
+        assert _BULK_STATUS_REQUESTS[-2:] == (
+            ("getMaxStepLimit", {"contextType": "invoke"}),
+            ("getMaxStepLimit", {"contextType": "query"}),
+        )
+
+    def test_create_call_params_format(self):
+        from iconsdk.builder.call_builder import CallBuilder
+        from iconsdk.icon_service import IconService
+
+        provider = mock.Mock()
+        service = IconService(provider)
+
+        for method, params in (
+                ("getVersion", None),
+                ("getMaxStepLimit", {"contextType": "invoke"}),
+                ("isDeployer", {"address": EOA_ADDRESS}),
+        ):
+            call = CallBuilder() \
+                .from_(EOA_ADDRESS) \
+                .to(GOVERNANCE_ADDRESS) \
+                .method(method) \
+                .params(params) \
+                .build()
+            service.call(call)
+
+            rpc_method, expected = provider.make_request.call_args[0][:2]
+            assert rpc_method == "icx_call"
+            assert self.reader._create_call_params(method, params) == expected
+
+    def test_call_without_provider(self):
+        reader = GovernanceReader(self.service, 3)
+        reader.set_on_send_request(lambda content: None)
+        self.service.call.return_value = "0x6"
+
+        assert reader.get_max_step_limit("invoke") == 6
+
+        call = self.service.call.call_args[0][0]
+        assert call.from_ == EOA_ADDRESS
+        assert call.to == GOVERNANCE_ADDRESS
+        assert call.method == "getMaxStepLimit"
+        assert call.params == {"contextType": "invoke"}
+
+    def test_call_int(self):
+        self.provider.make_request.return_value = "0x2e90edd00"
+        assert self.reader.get_step_price() == 12500000000
+
+        for i, (value, expected) in enumerate((("0x0", 0), ("0x1", 1), ("0x2", 2))):
+            self.provider.make_request.return_value = value
+            ret = self.reader.is_deployer(f"hx{i:040x}")
+            assert ret == expected and type(ret) is int
+
+    def test_typed_results(self):
+        self.provider.make_request.return_value = {"default": "0x186a0", "apiCall": "0x2710"}
+
+        assert self.reader.get_step_costs() == {"default": "0x186a0", "apiCall": "0x2710"}
+        assert self.reader.get_step_costs(raw=False).apiCall == 10000
+
+        self.provider.make_batch_request.return_value = [{"AUDIT": "0x1"}]
+        batch = self.reader.create_batch()
+        self.reader.get_service_config(batch=batch, raw=False)
+        config, = batch.execute()
+        assert config.audit
+
+    def test_cache(self):
+        reader = GovernanceReader(self.service, 3, provider=self.provider, cache_config=RPCCacheConfig(enabled=True))
+        reader.set_on_send_request(lambda content: None)
+        self.provider.make_request.return_value = {"AUDIT": "0x1"}
+
+        assert reader.check_if_audit_enabled()
+        assert reader.get_service_config() == {"AUDIT": "0x1"}
+        assert self.provider.make_request.call_count == 1
+
+        # A cached result which a caller modifies stays the same
+        reader.get_service_config()["AUDIT"] = "0x0"
+        assert reader.get_service_config() == {"AUDIT": "0x1"}
+        assert self.provider.make_request.call_count == 1
+
+        # Methods which are not in READONLY_ALLOWLIST are never cached
+        reader.get_score_status("cx0000000000000000000000000000000000000002")
+        reader.get_score_status("cx0000000000000000000000000000000000000002")
+        assert self.provider.make_request.call_count == 3
+
+    def test_service_config(self):
+        # The config is fetched once per reader even though the cache is disabled by default
+        self.provider.make_request.return_value = {"AUDIT": "0x1", "fee": "0x0"}
+
+        assert self.reader.check_if_audit_enabled()
+        assert self.reader.get_service_config()["fee"] == "0x0"
+        assert self.reader.get_service_config(raw=False).extra == {"fee": False}
+        assert self.provider.make_request.call_count == 1
+
+        # A config which a caller modifies stays the same
+        self.reader.get_service_config()["AUDIT"] = "0x0"
+        assert self.reader.check_if_audit_enabled()
+        assert self.provider.make_request.call_count == 1
+
+        # It is fetched again after clear_cache()
+        self.reader.clear_cache()
+        self.provider.make_request.return_value = {"AUDIT": "0x0", "fee": "0x0"}
+        assert not self.reader.check_if_audit_enabled()
+        assert self.provider.make_request.call_count == 2
+
+    def test_cache_disabled(self):
+        # The cache is disabled by default
+        reader = GovernanceReader(self.service, 3)
+        reader.set_on_send_request(lambda content: None)
+        self.service.call.return_value = "0x6"
+
+        reader.get_revision()
+        reader.get_revision()
+        assert self.service.call.call_count == 2
+
+    def test_batch_call_with_cache(self):
+        reader = GovernanceReader(self.service, 3, provider=self.provider, cache_config=RPCCacheConfig(enabled=True))
+        reader.set_on_send_request(lambda content: None)
+        self.provider.make_request.return_value = "0x6"
+        reader.get_revision()
+
+        self.provider.make_batch_request.return_value = ["0x2e90edd00"]
+        results = reader.batch_call([("getRevision", None), ("getStepPrice", None)])
+        assert results == ["0x6", "0x2e90edd00"]
+
+        requests, _ = self.provider.make_batch_request.call_args[0]
+        assert len(requests) == 1
+
+    def test_gather_calls(self):
+        async def make_async_request(method, params, session):
+            address = params["data"]["params"]["address"]
+            if address == "cx1":
+                raise ValueError(address)
+            if address == "cx2":
+                raise JSONRPCException({"code": -32000, "message": address})
+            return {"address": address}
+
+        self.provider.make_async_request.side_effect = make_async_request
+        self.provider.create_async_session.return_value = mock.MagicMock()
+
+        requests = [("getScoreStatus", {"address": f"cx{i}"}) for i in range(4)]
+        results = asyncio.run(self.reader.gather_calls(requests, concurrency=2, return_exceptions=True))
+
+        assert results[0] == {"address": "cx0"}
+        assert isinstance(results[1], ValueError)
+        assert isinstance(results[2], JSONRPCException)
+        assert results[3] == {"address": "cx3"}
+        assert self.provider.make_async_request.call_count == 4
+        self.provider.create_async_session.assert_called_once()
+
+    def test_gather_calls_without_async_client(self):
+        # Without httpx and h2 or aiohttp, blocking calls run in threads
+        self.provider.can_create_async_session.return_value = False
+        self.provider.make_request.side_effect = lambda method, params: params["data"]["params"]
+
+        requests = [("getScoreStatus", {"address": f"cx{i}"}) for i in range(3)]
+        results = asyncio.run(self.reader.gather_calls(requests))
+
+        assert results == [{"address": f"cx{i}"} for i in range(3)]
+        self.provider.create_async_session.assert_not_called()
+        self.provider.make_async_request.assert_not_called()
+
+    def test_get_score_status_command(self):
+        from governor.score_command import _get_score_status
+
+        async def make_async_request(method, params, session):
+            address = params["data"]["params"]["address"]
+            if address == "cxbad":
+                raise JSONRPCException({"code": -32000, "message": address})
+            return {"address": address}
+
+        self.provider.make_async_request.side_effect = make_async_request
+        self.provider.create_async_session.return_value = mock.MagicMock()
+
+        args = mock.Mock(address=["cx1", "cxbad"])
+        with mock.patch("governor.score_command.create_reader_by_args", return_value=self.reader), \
+                mock.patch("governor.score_command.print_response") as print_response:
+            assert _get_score_status(args) == 1
+
+        result = print_response.call_args[0][0]
+        assert result["cx1"] == {"address": "cx1"}
+        assert isinstance(result["cxbad"], str)
+        json.dumps(result)
+
+        args = mock.Mock(address=["cx1", "cx2"])
+        with mock.patch("governor.score_command.create_reader_by_args", return_value=self.reader), \
+                mock.patch("governor.score_command.print_response"):
+            assert _get_score_status(args) == 0
+
+        # A repeated address is queried once
+        self.provider.make_async_request.reset_mock()
+        args = mock.Mock(address=["cx1", "cx2", "cx1"])
+        with mock.patch("governor.score_command.create_reader_by_args", return_value=self.reader), \
+                mock.patch("governor.score_command.print_response") as print_response:
+            assert _get_score_status(args) == 0
+
+        assert list(print_response.call_args[0][0]) == ["cx1", "cx2"]
+        assert self.provider.make_async_request.call_count == 2
+
+
+class TestGovernanceWriter(unittest.TestCase):
+    def setUp(self):
+        self.writer = GovernanceWriter(mock.Mock(), 3, mock.Mock())
+
+    def test_invoke_methods(self):
+        with mock.patch.object(GovernanceWriter, "_call", return_value="0x1234") as call:
+            assert self.writer.reject_score("0xabcd", reason="test") == "0x1234"
+            call.assert_called_with("rejectScore", {"txHash": "0xabcd", "reason": "test"})
+
+            self.writer.set_revision(7, "1.6.0")
+            call.assert_called_with("setRevision", {"code": 7, "name": "1.6.0"})
+
+            self.writer.update_service_config(service_flag=3)
+            call.assert_called_with("updateServiceConfig", {"serviceFlag": 3})
+
+    def test_estimate_step_limit(self):
+        service = mock.Mock()
+        service.estimate_step.return_value = 0x1234
+        service.send_transaction.return_value = "0xabcd"
+        owner = mock.Mock()
+        owner.get_address.return_value = EOA_ADDRESS
+        owner.sign.return_value = b"signature"
+
+        writer = GovernanceWriter(service, 3, owner, estimate_step_limit=True)
+        writer.set_on_send_request(lambda content: True)
+
+        assert writer.set_revision(7, "1.6.0") == "0xabcd"
+
+        # The estimate gets a margin of 10 percent
+        transaction = service.estimate_step.call_args[0][0]
+        signed_transaction = service.send_transaction.call_args[0][0]
+        assert signed_transaction.signed_transaction_dict["stepLimit"] == hex(0x1234 + 0x1234 // 10)
+        assert transaction.step_limit == 0x1234 + 0x1234 // 10
+
+        # Without the option, the default step limit is used without estimating
+        writer = GovernanceWriter(service, 3, owner)
+        writer.set_on_send_request(lambda content: True)
+        writer.set_revision(7, "1.6.0")
+
+        assert service.estimate_step.call_count == 1
+        assert service.send_transaction.call_args[0][0].signed_transaction_dict["stepLimit"] == "0x10000000"
+
+    def test_invoke_method_specs(self):
+        from governor.governance import _add_invoke_methods
+        from governor.score_command import _INVOKE_COMMANDS, _QUERY_COMMANDS
+
+        for _, method, arg_name, _, _ in _INVOKE_COMMANDS:
+            assert arg_name in inspect.signature(getattr(GovernanceWriter, method)).parameters
+        for _, method, arg_name in _QUERY_COMMANDS:
+            assert arg_name in inspect.signature(getattr(GovernanceReader, method)).parameters
+
+        with self.assertRaises(ValueError):
+            _add_invoke_methods(
+                GovernanceWriter, (("add_auditor", "addAuditor", (("address", "str", "address"),), ""),))
+        with self.assertRaises(ValueError):
+            _add_invoke_methods(GovernanceWriter, (("foo", "foo", (("a-b", "str", "a"),), ""),))
+        # Method names and param keys go into the generated source as well
+        with self.assertRaises(ValueError):
+            _add_invoke_methods(GovernanceWriter, (("foo", 'foo", {}); import os; ("', (), ""),))
+        with self.assertRaises(ValueError):
+            _add_invoke_methods(GovernanceWriter, (("foo", "foo", (("a", "str", 'a": 1, "b'),), ""),))
+        assert not hasattr(GovernanceWriter, "foo")
+
+        doc = inspect.getdoc(GovernanceWriter.set_revision)
+        assert doc.startswith("Set revision to governance SCORE")
+        assert ":param revision: code param of setRevision" in doc
+        assert ":param name: name param of setRevision" in doc
+
+    def test_command_order(self):
+        import argparse
+        from governor import score_command
+
+        parser = argparse.ArgumentParser()
+        sub_parser = parser.add_subparsers()
+        parent_parser = argparse.ArgumentParser(add_help=False)
+        score_command.init(sub_parser, parent_parser, parent_parser)
+
+        # Subcommands are listed in `governor -h` in the order they are registered
+        assert list(sub_parser.choices) == [
+            "update", "acceptScore", "rejectScore",
+            "addAuditor", "removeAuditor", "addDeployer", "removeDeployer",
+            "addToScoreBlackList", "removeFromScoreBlackList", "addImportWhiteList", "removeImportWhiteList",
+            "getScoreStatus", "getServiceConfig", "updateServiceConfig",
+            "isDeployer", "isInScoreBlackList", "isInImportWhiteList",
+        ]
+
+    def test_update_and_accept(self):
+        from iconsdk.wallet.wallet import KeyWallet
+
+        key_wallet = KeyWallet.create()
+        owner = mock.Mock(wraps=key_wallet)
+        provider = mock.Mock()
+        provider.make_batch_request.return_value = ["0x1", "0x2"]
+
+        writer = GovernanceWriter(mock.Mock(), 3, owner, provider=provider)
+        writer.set_on_send_request(lambda content: True)
+
+        with tempfile.TemporaryDirectory() as score_path:
+            with open(os.path.join(score_path, "package.json"), "w") as f:
+                json.dump({"version": "1.0.0", "main_module": "governance"}, f)
+
+            assert writer.update_and_accept(score_path) == ["0x1", "0x2"]
+
+        (update, accept), = provider.make_batch_request.call_args[0]
+        assert provider.make_batch_request.call_args[1] == {"return_exceptions": True}
+        assert update[0] == accept[0] == "icx_sendTransaction"
+        assert update[1]["dataType"] == "deploy"
+
+        # The tx hash of the update is the message hash which the owner has signed for it
+        tx_hash = owner.sign.call_args_list[0][0][0]
+        assert accept[1]["data"] == {"method": "acceptScore", "params": {"txHash": f"0x{tx_hash.hex()}"}}
+        assert accept[1]["stepLimit"] == "0x10000000"
+
+    def test_update_and_accept_without_provider(self):
+        from iconsdk.exception import JSONRPCException
+        from iconsdk.wallet.wallet import KeyWallet
+
+        service = mock.Mock()
+        service.estimate_step.return_value = 0x1000
+        writer = GovernanceWriter(service, 3, KeyWallet.create(), estimate_step_limit=True)
+        writer.set_on_send_request(lambda content: True)
+
+        with tempfile.TemporaryDirectory() as score_path:
+            with open(os.path.join(score_path, "package.json"), "w") as f:
+                json.dump({"version": "1.0.0", "main_module": "governance"}, f)
+
+            service.send_transaction.side_effect = ["0x1", JSONRPCException("Out of step", -32000)]
+            ret = writer.update_and_accept(score_path)
+            assert ret[0] == "0x1" and isinstance(ret[1], JSONRPCException)
+
+            # The update is sent with its estimated steps and acceptScore with the default step limit
+            update, accept = (call[0][0].signed_transaction_dict for call in service.send_transaction.call_args_list)
+            assert update["stepLimit"] == hex(0x1000 + 0x1000 // 10)
+            assert accept["stepLimit"] == "0x10000000"
+
+            # acceptScore is not sent if the update fails
+            service.send_transaction.reset_mock()
+            service.send_transaction.side_effect = JSONRPCException("Invalid params", -32602)
+            ret = writer.update_and_accept(score_path)
+            assert isinstance(ret[0], JSONRPCException) and ret[1] is None
+            assert service.send_transaction.call_count == 1
+
+            # Declining the update sends nothing
+            service.send_transaction.reset_mock()
+            writer.set_on_send_request(lambda content: False)
+            assert writer.update_and_accept(score_path) is False
+            service.send_transaction.assert_not_called()
+
+    def test_print_tx_results(self):
+        from governor import __main__
+
+        with mock.patch.object(__main__, "_print_tx_result") as print_tx_result:
+            # The result of each transaction which has been sent is printed
+            args = mock.Mock(no_result=False)
+            assert __main__._print_tx_results(args, ["0x1", JSONRPCException("Out of step", -32000)]) == 1
+            print_tx_result.assert_called_once_with(args, tx_hash="0x1")
+
+            print_tx_result.reset_mock()
+            args = mock.Mock(no_result=True)
+            assert __main__._print_tx_results(args, ["0x1", "0x2"]) == 0
+            print_tx_result.assert_not_called()
+
+    def test_invalid_types(self):
+        with mock.patch.object(GovernanceWriter, "_call") as call:
+            with self.assertRaises(ValueError):
+                self.writer.set_step_cost("foo", 100)
+            with self.assertRaises(ValueError):
+                self.writer.set_max_step_limit("bar", 100)
+            call.assert_not_called()
+
+            self.writer.set_step_cost("apiCall", 100)
+            call.assert_called_with("setStepCost", {"stepType": "apiCall", "cost": 100})
+
+            self.writer.set_max_step_limit("query", 100)
+            call.assert_called_with("setMaxStepLimit", {"contextType": "query", "value": 100})
+
+
+class TestScoreContent(unittest.TestCase):
+    def test_get_score_content(self):
+        from governor.governance import _get_score_content
+
+        with tempfile.TemporaryDirectory() as score_path:
+            with open(os.path.join(score_path, "package.json"), "w") as f:
+                json.dump({"version": "1.0.0", "main_module": "governance"}, f)
+
+            path = os.path.join(score_path, "governance.py")
+            with open(path, "w") as f:
+                f.write("VERSION = 0\n")
+
+            content = _get_score_content(score_path)
+            assert _get_score_content(score_path) is content
+
+            # A change of a file other than package.json makes the SCORE zipped again
+            with open(path, "w") as f:
+                f.write("VERSION = 10\n")
+            mtime_ns = os.stat(path).st_mtime_ns + 10 ** 9
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+
+            assert _get_score_content(score_path) != content
+
+        with self.assertRaises(Exception):
+            _get_score_content(score_path)
+
+
+class TestTxBuildHelper(unittest.TestCase):
+    def test_invoke(self):
+        from iconsdk.builder.transaction_builder import CallTransactionBuilder
+
+        owner = mock.Mock()
+        owner.get_address.return_value = EOA_ADDRESS
+
+        transaction = TxBuildHelper(mock.Mock(), 3).invoke(owner, GOVERNANCE_ADDRESS, "setRevision", {"code": 7})
+        expected = CallTransactionBuilder() \
+            .from_(EOA_ADDRESS) \
+            .to(GOVERNANCE_ADDRESS) \
+            .step_limit(0x10000000) \
+            .nid(3) \
+            .method("setRevision") \
+            .params({"code": 7}) \
+            .build()
+
+        assert transaction.to_dict() == expected.to_dict()
+        assert transaction.data == expected.data
+
+
+class TestCreateProvider(unittest.TestCase):
+    def test_create_provider(self):
+        provider = create_provider("http://127.0.0.1:9000/api/v3")
+        assert provider is create_provider("localhost")
+        assert provider is not create_provider("mainnet")
+
+    def test_create_provider_with_invalid_url(self):
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                create_provider("ftp://127.0.0.1/api/v3")
+
+
+class TestKeystoreWallet(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        self._write_keystore(EOA_ADDRESS)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _write_keystore(self, address: str):
+        with open(self.path, "w") as f:
+            json.dump({"address": address, "crypto": {}}, f)
+
+    def test_get_address(self):
+        wallet = KeystoreWallet(self.path)
+
+        with mock.patch("iconsdk.wallet.wallet.KeyWallet.load") as load:
+            assert wallet.get_address() == EOA_ADDRESS
+            load.assert_not_called()
+
+    def test_unlock(self):
+        from iconsdk.wallet.wallet import KeyWallet
+
+        key_wallet = KeyWallet.create()
+        self._write_keystore(key_wallet.get_address())
+
+        wallet = KeystoreWallet(self.path, "password")
+        with mock.patch("iconsdk.wallet.wallet.KeyWallet.load", return_value=key_wallet):
+            wallet.unlock()
+
+        # The password is cleared once the key is derived
+        assert wallet._password is None
+        assert wallet.get_address() == key_wallet.get_address()
+
+    def test_unlock_with_address_mismatch(self):
+        from iconsdk.wallet.wallet import KeyWallet
+
+        wallet = KeystoreWallet(self.path, "password")
+        assert wallet.get_address() == EOA_ADDRESS
+
+        with mock.patch("iconsdk.wallet.wallet.KeyWallet.load", return_value=KeyWallet.create()):
+            with self.assertRaises(ValueError):
+                wallet.unlock()
+
+    def test_unlock_before_confirm(self):
+        from governor.governance import _unlock_and_call
+
+        calls = []
+        wallet = mock.Mock()
+        wallet.unlock.side_effect = lambda: calls.append("unlock")
+
+        assert _unlock_and_call(wallet, lambda content: calls.append("confirm") or True, {})
+        assert calls == ["unlock", "confirm"]
+
+    def test_sign(self):
+        from iconsdk.wallet.wallet import KeyWallet
+
+        key_wallet = KeyWallet.create()
+        self._write_keystore(key_wallet.get_address())
+        wallet = KeystoreWallet(self.path, "password")
+        data = bytes(range(32))
+
+        with mock.patch("iconsdk.wallet.wallet.KeyWallet.load", return_value=key_wallet) as load:
+            assert wallet.sign(data) == key_wallet.sign(data)
+            assert wallet.sign(data) == key_wallet.sign(data)
+            load.assert_called_once_with(self.path, "password")
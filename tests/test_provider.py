@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import sys
+import unittest
+from unittest import mock
+
+from iconsdk.exception import JSONRPCException
+
+from governor import provider
+from governor.provider import HTTPProvider, _dumps
+from governor.utils import import_httpx
+
+
+class Response(object):
+    def __init__(self, content, status_code: int = 200):
+        self.content = json.dumps(content).encode()
+        self.status_code = status_code
+        self.ok = status_code == 200
+
+
+def _reply(request_url, data, **kwargs):
+    # Reply in reverse order to check if responses are reordered by id
+    contents = [{"jsonrpc": "2.0", "id": rpc["id"], "result": hex(rpc["id"])} for rpc in data]
+    return Response(contents[::-1])
+
+
+class TestHTTPProvider(unittest.TestCase):
+    def setUp(self):
+        self.provider = HTTPProvider("http://127.0.0.1:9000", 3)
+
+    def test_make_batch_request(self):
+        requests = [("icx_call", {"id": i}) for i in range(5)]
+
+        with mock.patch.object(HTTPProvider, "_make_post_request", side_effect=_reply) as post:
+            results = self.provider.make_batch_request(requests)
+
+        assert post.call_count == 1
+        assert results == [hex(i) for i in range(5)]
+
+    def test_make_batch_request_with_batch_size(self):
+        requests = [("icx_call", None) for _ in range(7)]
+
+        with mock.patch.object(HTTPProvider, "_make_post_request", side_effect=_reply) as post:
+            results = self.provider.make_batch_request(requests, batch_size=3)
+
+        assert post.call_count == 3
+        assert results == [hex(i) for i in range(7)]
+
+    def test_make_batch_request_with_error(self):
+        def reply(request_url, data, **kwargs):
+            return Response([
+                {"jsonrpc": "2.0", "id": 0, "result": "0x0"},
+                {"jsonrpc": "2.0", "id": 1, "error": {"code": -32601, "message": "Method not found"}},
+            ])
+
+        with mock.patch.object(HTTPProvider, "_make_post_request", side_effect=reply):
+            with self.assertRaises(JSONRPCException):
+                self.provider.make_batch_request([("icx_call", None), ("icx_foo", None)])
+
+    def test_make_batch_request_with_return_exceptions(self):
+        def reply(request_url, data, **kwargs):
+            return Response([
+                {"jsonrpc": "2.0", "id": 1, "error": {"code": -32602, "message": "Invalid params"}},
+                {"jsonrpc": "2.0", "id": 0, "result": "0x1234"},
+            ])
+
+        with mock.patch.object(HTTPProvider, "_make_post_request", side_effect=reply):
+            results = self.provider.make_batch_request(
+                [("icx_sendTransaction", None), ("icx_sendTransaction", None)], return_exceptions=True)
+
+        assert results[0] == "0x1234"
+        assert isinstance(results[1], JSONRPCException)
+
+    def test_session(self):
+        session = self.provider.session
+        assert session is self.provider.session
+        assert session is not HTTPProvider("http://127.0.0.1:9000", 3).session
+
+    @unittest.skipIf(import_httpx() is None, "httpx and h2 are not installed")
+    def test_http2_session(self):
+        assert isinstance(self.provider.session, import_httpx().Client)
+        assert isinstance(self.provider.create_async_session(), import_httpx().AsyncClient)
+
+    def test_create_async_session_without_packages(self):
+        with mock.patch.object(provider, "import_httpx", return_value=None), \
+                mock.patch.dict(sys.modules, {"aiohttp": None}):
+            assert not self.provider.can_create_async_session()
+            with self.assertRaises(ImportError):
+                self.provider.create_async_session()
+
+    @unittest.skipIf(import_httpx() is None, "httpx and h2 are not installed")
+    def test_make_async_request_timeout(self):
+        session = mock.AsyncMock(spec=import_httpx().AsyncClient)
+        session.post.return_value = mock.Mock(content=b'{"jsonrpc": "2.0", "id": 1, "result": "0x1"}')
+
+        assert asyncio.run(self.provider.make_async_request("icx_call", {}, session=session)) == "0x1"
+        assert session.post.call_args[1]["timeout"] == 10
+
+    def test_requests_session(self):
+        with mock.patch.object(provider, "import_httpx", return_value=None):
+            session = self.provider.session
+            assert isinstance(session, provider.requests.Session)
+
+        assert session.headers["Connection"] == "keep-alive"
+
+        retries = session.get_adapter("https://ctz.solidwallet.io").max_retries
+        assert retries.total == 3
+        assert not retries.read
+
+    def test_dumps(self):
+        data = {"value": 2 ** 256, "params": {"a": "0x1"}}
+        assert json.loads(_dumps(data)) == data
+
+    def test_make_request(self):
+        def reply(request_url, data, **kwargs):
+            return Response({"jsonrpc": "2.0", "id": data["id"], "result": {"AUDIT": "0x1"}})
+
+        with mock.patch.object(HTTPProvider, "_make_post_request", side_effect=reply):
+            assert self.provider.make_request("icx_call", {}) == {"AUDIT": "0x1"}
+
+    def test_make_request_with_error(self):
+        def reply(request_url, data, **kwargs):
+            content = {"jsonrpc": "2.0", "id": data["id"], "error": {"code": -32000, "message": "Server error"}}
+            return Response(content, status_code=500)
+
+        with mock.patch.object(HTTPProvider, "_make_post_request", side_effect=reply):
+            with self.assertRaises(JSONRPCException):
+                self.provider.make_request("icx_call", {})
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from governor.results import ServiceConfig, StepCosts
+
+
+class TestStepCosts(unittest.TestCase):
+    def test_from_dict(self):
+        step_costs = StepCosts.from_dict({"default": "0x186a0", "apiCall": "0x2710", "unknown": "0x1"})
+
+        assert step_costs.default == 100000
+        assert step_costs.apiCall == 10000
+        assert step_costs.contractCall is None
+        # Unknown step types are kept
+        assert step_costs.extra == {"unknown": 1}
+        assert step_costs.to_dict() == {"default": 100000, "apiCall": 10000, "unknown": 1}
+        assert step_costs == StepCosts(default=100000, apiCall=10000, unknown=1)
+        assert step_costs != StepCosts(default=100000, apiCall=10000)
+        assert hash(step_costs) == hash(StepCosts(default=100000, apiCall=10000, unknown=1))
+
+    def test_read_only(self):
+        step_costs = StepCosts(default=100000)
+
+        with self.assertRaises(AttributeError):
+            step_costs.default = 0
+        with self.assertRaises(AttributeError):
+            step_costs.foo = 0
+        # extra is read-only as well, not to change the hash
+        with self.assertRaises(TypeError):
+            StepCosts(unknown=1).extra["unknown"] = 2
+
+
+class TestServiceConfig(unittest.TestCase):
+    def test_from_dict(self):
+        config = ServiceConfig.from_dict({"AUDIT": "0x1", "FEE": "0x0", "NEW_FLAG": "0x1"})
+
+        assert config.audit
+        assert not config.fee
+        assert not config.deployer_white_list
+        assert config.extra == {"NEW_FLAG": True}
+        assert config.to_dict() == {
+            "FEE": False, "AUDIT": True, "DEPLOYER_WHITE_LIST": False, "SCORE_PACKAGE_VALIDATOR": False,
+            "NEW_FLAG": True
+        }
+        assert config == ServiceConfig(audit=True, extra={"NEW_FLAG": True})
+        assert hash(config) == hash(ServiceConfig(audit=True, extra={"NEW_FLAG": True}))
+        assert not ServiceConfig().audit
+
+    def test_read_only(self):
+        config = ServiceConfig(audit=True)
+
+        with self.assertRaises(AttributeError):
+            config.audit = False
+
+        extra = {"NEW_FLAG": True}
+        config = ServiceConfig(extra=extra)
+        extra["NEW_FLAG"] = False
+        assert config.extra == {"NEW_FLAG": True}
+        with self.assertRaises(TypeError):
+            config.extra["NEW_FLAG"] = False